@@ -4,41 +4,93 @@ import asyncio
 import json
 import logging
 import mimetypes
+import operator
 import os
 import random
-from dataclasses import dataclass
-from typing import Optional
-
+import re
+import time
+from dataclasses import asdict, dataclass
+from string import Formatter
+from typing import Callable, Optional
+
+import httpx
+import orjson
 from google import genai
 from google.genai import types
 
+from .ai_cache import (
+    LLMCache,
+    SemanticCache,
+    SingleFlight,
+    make_cache_key,
+    normalize_vector,
+)
+
 logger = logging.getLogger(__name__)
 
-# Token usage tracking (reset each fetch cycle)
-_token_stats = {
-    "classify_calls": 0,
-    "translate_calls": 0,
-    "input_tokens": 0,
-    "output_tokens": 0,
-}
+
+@dataclass(slots=True)
+class TokenStats:
+    """Gemini API usage counters for one fetch cycle."""
+
+    classify_calls: int = 0
+    translate_calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    skipped_calls: int = 0  # decided locally without calling Gemini
+
+
+# Token usage tracking (reset each fetch cycle). Only mutated from the event
+# loop thread, so plain increments need no lock.
+_token_stats = TokenStats()
+
+# Shared Gemini client and its HTTP connection pool settings
+_gemini_client: Optional[genai.Client] = None
+_gemini_api_key: Optional[str] = None
+GEMINI_KEEPALIVE_CONNECTIONS = 32
+GEMINI_MAX_CONNECTIONS = 64
+GEMINI_KEEPALIVE_EXPIRY = 60.0  # seconds
 
 # Circuit breaker state — shared between classify and translate since both
 # hit the same Gemini API; repeated failures in either indicate an API outage
 _consecutive_failures = 0
 CIRCUIT_BREAKER_THRESHOLD = 3
 
+# Exact-match cache of classification/translation results, keyed by prompt hash
+_response_cache = LLMCache()
+
+# In-flight classify/translate calls, so concurrent duplicates share one request
+_inflight = SingleFlight()
+
+# Near-duplicate cache of classification results, keyed by content embedding
+_semantic_cache = SemanticCache()
+EMBEDDING_MODEL = "text-embedding-004"
+
+# Zero-shot pre-rejection against the INCLUDE/EXCLUDE rule bullets (embeddings
+# come from EMBEDDING_MODEL). Only articles whose best exclude label beats the
+# best include label by more than the margin skip the generate call; nothing is
+# accepted without Gemini applying the full rules.
+ZERO_SHOT_MARGIN = 0.2
+_label_embeddings: Optional[tuple[list[list[float]], list[list[float]]]] = None
+
+# Gemini context cache holding the static classifier rules
+PROMPT_CACHE_TTL = 3600  # seconds
+PROMPT_CACHE_REFRESH_MARGIN = 600  # recreate when less than this is left
+PROMPT_CACHE_RETRY_DELAY = 6 * 3600  # after a failed create (usually permanent)
+_prompt_cache_name: Optional[str] = None
+_prompt_cache_model: Optional[str] = None
+_prompt_cache_expires = 0.0
+_prompt_cache_retry_at = 0.0
+
 
 def reset_token_stats() -> None:
     """Reset token statistics for a new fetch cycle."""
-    _token_stats["classify_calls"] = 0
-    _token_stats["translate_calls"] = 0
-    _token_stats["input_tokens"] = 0
-    _token_stats["output_tokens"] = 0
+    _token_stats.__init__()
 
 
 def get_token_stats() -> dict:
     """Get current token usage statistics."""
-    return _token_stats.copy()
+    return asdict(_token_stats)
 
 
 def reset_circuit_breaker() -> None:
@@ -52,98 +104,186 @@ def is_circuit_open() -> bool:
     return _consecutive_failures >= CIRCUIT_BREAKER_THRESHOLD
 
 
+def load_response_cache(path: str) -> int:
+    """Load persisted Gemini responses. Returns number of entries loaded."""
+    return _response_cache.load(path)
+
+
+def save_response_cache(path: str) -> int:
+    """Persist cached Gemini responses. Returns number of entries saved."""
+    return _response_cache.save(path)
+
+
+_get_usage_counts = operator.attrgetter("prompt_token_count", "candidates_token_count")
+
+
 def _log_token_usage(response, call_type: str) -> None:
     """Extract and log token usage from Gemini response."""
     try:
-        usage = response.usage_metadata
-        if usage:
-            input_tokens = getattr(usage, "prompt_token_count", 0) or 0
-            output_tokens = getattr(usage, "candidates_token_count", 0) or 0
-            _token_stats["input_tokens"] += input_tokens
-            _token_stats["output_tokens"] += output_tokens
-            logger.debug(
-                f"{call_type}: {input_tokens} input + {output_tokens} output tokens"
-            )
-    except Exception:
-        pass  # Don't fail if usage metadata unavailable
+        input_tokens, output_tokens = _get_usage_counts(response.usage_metadata)
+    except AttributeError:
+        return  # Don't fail if usage metadata unavailable
+    input_tokens = input_tokens or 0
+    output_tokens = output_tokens or 0
+    _token_stats.input_tokens += input_tokens
+    _token_stats.output_tokens += output_tokens
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"{call_type}: {input_tokens} input + {output_tokens} output tokens"
+        )
+
+
+def _response_text(response) -> str:
+    """
+    Text of the first answer part, read directly instead of through the SDK's
+    response.text property (which walks every candidate and part).
+    Falls back to response.text for unusual shapes such as multi-part answers.
+    """
+    try:
+        parts = response.candidates[0].content.parts
+        if len(parts) == 1 and not parts[0].thought and parts[0].text is not None:
+            return parts[0].text
+    except (AttributeError, IndexError, TypeError):
+        pass
+    return response.text or ""
 
 
-# Content truncation limits
+# Content truncation limits, in characters
 CLASSIFY_CONTENT_LIMIT = 3000
 TRANSLATE_CONTENT_LIMIT = 4000
 
+# Input-token estimate for rate pacing only: UTF-8 bytes / 4 overestimates
+# Cyrillic text, which keeps the TPM limiter on the safe side
+BYTES_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Conservative Gemini token estimate for pacing (not for truncation)."""
+    return len(text.encode()) // BYTES_PER_TOKEN
+
+
 # Exponential backoff settings
 MAX_RETRIES = 5
 BASE_DELAY = 1.0  # seconds
 MAX_DELAY = 60.0  # seconds
+CALL_DEADLINE = 30.0  # total wall time for one call including retries
+MEDIA_CALL_DEADLINE = 120.0  # translation with image/video uploads is slower
+
+# Error messages worth retrying: rate limits and transient server/network errors
+_RATE_LIMIT_PATTERN = r"rate limit|quota|429|resource exhausted|too many requests|overloaded"
+_TRANSIENT_PATTERN = r"timeout|connection|50[023]|unavailable|internal error"
+_RETRYABLE_ERROR_RE = re.compile(
+    f"{_RATE_LIMIT_PATTERN}|{_TRANSIENT_PATTERN}", re.IGNORECASE
+)
+
+# Proactive pacing below the Gemini quota (avoids 429s instead of reacting to them)
+GEMINI_MAX_CONCURRENT = 4
+GEMINI_RPM = 60  # requests per minute
+GEMINI_TPM = 1_000_000  # input tokens per minute
+
+
+class _RateLimiter:
+    """Token bucket allowing `rate` units per `period` seconds (bursts up to `rate`)."""
+
+    def __init__(self, rate: float, period: float = 60.0):
+        self.capacity = rate
+        self._tokens = rate
+        self._fill_rate = rate / period
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1) -> None:
+        """Wait until `amount` units are available, then take them (FIFO)."""
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated) * self._fill_rate,
+                )
+                self._updated = now
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                await asyncio.sleep((amount - self._tokens) / self._fill_rate)
+
+
+_gemini_semaphore = asyncio.Semaphore(GEMINI_MAX_CONCURRENT)
+_request_limiter = _RateLimiter(GEMINI_RPM)
+_input_token_limiter = _RateLimiter(GEMINI_TPM)
 
 
 async def call_with_backoff(
     func,
     *args,
     max_retries: int = MAX_RETRIES,
+    estimated_tokens: int = 0,
+    deadline: float = CALL_DEADLINE,
     **kwargs,
 ):
     """
     Call an async function with exponential backoff on failure.
     Handles rate limits and transient errors.
+    Each attempt is paced by the shared concurrency, request and input-token
+    limits (estimated_tokens is the approximate prompt size).
+    The whole call, retries included, must finish within deadline seconds of
+    first getting a slot (time queued behind other calls doesn't count);
+    otherwise TimeoutError is raised.
     """
     last_exception = None
+    loop = asyncio.get_running_loop()
+    expires_at = None
 
-    for attempt in range(max_retries):
-        try:
-            return await func(*args, **kwargs)
-        except Exception as e:
-            last_exception = e
-            error_str = str(e).lower()
-
-            # Check if it's a rate limit or retryable error
-            is_rate_limit = any(
-                x in error_str
-                for x in [
-                    "rate limit",
-                    "quota",
-                    "429",
-                    "resource exhausted",
-                    "too many requests",
-                    "overloaded",
-                ]
-            )
-            is_transient = any(
-                x in error_str
-                for x in [
-                    "timeout",
-                    "connection",
-                    "503",
-                    "502",
-                    "500",
-                    "unavailable",
-                    "internal error",
-                ]
-            )
-
-            if not (is_rate_limit or is_transient):
-                # Non-retryable error, don't waste time retrying
-                logger.error(f"Non-retryable error: {e}")
-                raise
-
-            # Calculate delay with jitter
-            delay = min(BASE_DELAY * (2**attempt), MAX_DELAY)
-            jitter = random.uniform(0, delay * 0.1)
-            total_delay = delay + jitter
-
-            logger.warning(
-                f"API call failed (attempt {attempt + 1}/{max_retries}): {e}. "
-                f"Retrying in {total_delay:.1f}s..."
-            )
-            await asyncio.sleep(total_delay)
+    try:
+        async with asyncio.timeout(None) as timeout:
+            for attempt in range(max_retries):
+                try:
+                    async with _gemini_semaphore:
+                        await _request_limiter.acquire()
+                        if estimated_tokens:
+                            await _input_token_limiter.acquire(estimated_tokens)
+                        if expires_at is None:
+                            expires_at = loop.time() + deadline
+                            timeout.reschedule(expires_at)
+                        return await func(*args, **kwargs)
+                except Exception as e:
+                    last_exception = e
+
+                    # Check if it's a rate limit or retryable error (single regex scan)
+                    if not _RETRYABLE_ERROR_RE.search(str(e)):
+                        # Non-retryable error, don't waste time retrying
+                        logger.error(f"Non-retryable error: {e}")
+                        raise
+
+                    # Calculate delay with jitter
+                    delay = min(BASE_DELAY * (2**attempt), MAX_DELAY)
+                    jitter = random.uniform(0, delay * 0.1)
+                    total_delay = delay + jitter
+
+                    # No point sleeping past the deadline just to be cancelled
+                    if total_delay > expires_at - loop.time():
+                        logger.error(
+                            f"API call failed (attempt {attempt + 1}/{max_retries}): {e}. "
+                            f"Not retrying, {deadline:.0f}s deadline would be exceeded"
+                        )
+                        raise
+
+                    logger.warning(
+                        f"API call failed (attempt {attempt + 1}/{max_retries}): {e}. "
+                        f"Retrying in {total_delay:.1f}s..."
+                    )
+                    await asyncio.sleep(total_delay)
+    except TimeoutError:
+        logger.error(f"API call exceeded {deadline:.0f}s deadline. Last error: {last_exception}")
+        raise
 
     # All retries exhausted
     logger.error(f"All {max_retries} retries failed. Last error: {last_exception}")
     raise last_exception
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassificationResult:
     """Result of article classification."""
 
@@ -151,7 +291,15 @@ class ClassificationResult:
     reason: str
 
 
-@dataclass
+def _parse_classification(entry: dict) -> ClassificationResult:
+    """Build a result from the model's JSON; anything but a literal true is irrelevant."""
+    return ClassificationResult(
+        is_relevant=entry.get("is_relevant") is True,
+        reason=entry.get("reason", ""),
+    )
+
+
+@dataclass(slots=True)
 class TranslationResult:
     """Result of article translation."""
 
@@ -161,11 +309,34 @@ class TranslationResult:
 
 
 def init_gemini(api_key: str) -> genai.Client:
-    """Initialize Gemini client."""
-    return genai.Client(api_key=api_key)
-
-
-CLASSIFIER_PROMPT = """You are a content classifier for a visual-first Telegram channel focused on amazing, curious, and viral content.
+    """
+    Initialize the shared Gemini client (re-init with the same key is a no-op).
+    Uses HTTP/2 with a keepalive pool so calls and retries reuse connections.
+    """
+    global _gemini_client, _gemini_api_key
+
+    if _gemini_client is not None and _gemini_api_key == api_key:
+        return _gemini_client
+
+    _gemini_client = genai.Client(
+        api_key=api_key,
+        http_options=types.HttpOptions(
+            async_client_args={
+                "http2": True,
+                "limits": httpx.Limits(
+                    max_keepalive_connections=GEMINI_KEEPALIVE_CONNECTIONS,
+                    max_connections=GEMINI_MAX_CONNECTIONS,
+                    keepalive_expiry=GEMINI_KEEPALIVE_EXPIRY,
+                ),
+            },
+        ),
+    )
+    _gemini_api_key = api_key
+    return _gemini_client
+
+
+# Classification rules shared by single-article and batch prompts
+CLASSIFIER_RULES = """You are a content classifier for a visual-first Telegram channel focused on amazing, curious, and viral content.
 
 Analyze the following article/post and determine if it's suitable for a visually-driven "wow factor" channel.
 
@@ -193,9 +364,10 @@ EXCLUDE content that:
 - Discusses LGBTQ+ topics
 - References terrorism, extremism, or radicalization
 - Mentions military conflicts, war propaganda, or sanctions
-- Contains defamation or insults toward any public figures or institutions
+- Contains defamation or insults toward any public figures or institutions"""
 
-Article Title: {title}
+# Per-article part of the classifier prompt (sent after the rules)
+CLASSIFIER_ARTICLE_PROMPT = """Article Title: {title}
 Article Content: {content}
 Media URL: {media_url}
 Source Type: {source_type}
@@ -204,6 +376,27 @@ Respond ONLY with valid JSON:
 {{"is_relevant": true/false, "reason": "brief explanation"}}"""
 
 
+def _rule_labels(heading: str) -> list[str]:
+    """Return the bullet lines listed under a heading of CLASSIFIER_RULES."""
+    section = CLASSIFIER_RULES.split(heading, 1)[1].split("\n\n", 1)[0]
+    return [line[2:] for line in section.splitlines() if line.startswith("- ")]
+
+
+INCLUDE_LABELS = _rule_labels("INCLUDE content about:")
+EXCLUDE_LABELS = _rule_labels("EXCLUDE content that:")
+
+CLASSIFIER_BATCH_ARTICLES_PROMPT = """Classify EACH article in the JSON array below independently.
+
+Articles:
+{articles}
+
+Respond ONLY with a valid JSON array containing one object per article:
+[{{"id": 0, "is_relevant": true/false, "reason": "brief explanation"}}]"""
+
+# Articles per batch classification request
+CLASSIFY_BATCH_SIZE = 10
+
+
 TRANSLATOR_PROMPT = """**Role:**
 You are the sole writer for the Telegram blog **"@olamda_nima_gap"** (What's happening in the world). You turn Reddit/internet finds into short, punchy Uzbek (Latin script) posts.
 
@@ -329,6 +522,163 @@ Original Content: {content}
 Write the complete formatted Telegram post in Uzbek:"""
 
 
+def _compile_template(template: str) -> Callable[..., str]:
+    """
+    Pre-split a str.format template into literals and field names once.
+    The returned render(**fields) joins the pieces without re-parsing the template.
+    """
+    literals: list[str] = []
+    fields: list[str] = []
+    pending = ""  # escaped braces split literals into several chunks
+    for literal, field, _, _ in Formatter().parse(template):
+        pending += literal
+        if field is not None:
+            literals.append(pending)
+            fields.append(field)
+            pending = ""
+    literals.append(pending)
+
+    head, tail = literals[0], literals[1:]
+
+    def render(**values: str) -> str:
+        parts = [head]
+        for field, literal in zip(fields, tail):
+            parts.append(values[field])
+            parts.append(literal)
+        return "".join(parts)
+
+    return render
+
+
+_render_classifier_article = _compile_template(CLASSIFIER_ARTICLE_PROMPT)
+_render_classifier_batch = _compile_template(CLASSIFIER_BATCH_ARTICLES_PROMPT)
+_render_translator = _compile_template(TRANSLATOR_PROMPT)
+
+# Separator between the classification JSON and the post in fused responses
+FUSED_SEPARATOR = "---TRANSLATION---"
+
+FUSED_PROMPT = (
+    "You have two tasks for one article: classify it, then write the Telegram post "
+    "ONLY if it is relevant.\n\n"
+    "=== TASK 1: CLASSIFICATION ===\n"
+    + CLASSIFIER_RULES
+    + """
+
+Media URL: {media_url}
+Source Type: {source_type}
+
+=== TASK 2: TELEGRAM POST (only if relevant) ===
+"""
+    + TRANSLATOR_PROMPT
+    + """
+
+=== OUTPUT FORMAT ===
+First output ONLY the classification as valid JSON on one line:
+{{"is_relevant": true/false, "reason": "brief explanation"}}
+If is_relevant is true, then output a line containing exactly """
+    + FUSED_SEPARATOR
+    + """ followed by the complete formatted Telegram post.
+If is_relevant is false, output nothing after the JSON."""
+)
+
+_render_fused = _compile_template(FUSED_PROMPT)
+
+
+# Title keywords that always fall under the classifier's EXCLUDE rules.
+# Kept to unambiguous terms; anything subtler is left to Gemini.
+_BLOCKED_TITLE_RE = re.compile(
+    r"\b(?:presidents?|elections?|senators?|parliament|prime minister"
+    r"|protest(?:s|ers)?|riots?|terroris[mt]s?|genocide|propaganda|sanctions"
+    r"|porn|nsfw)\b",
+    re.IGNORECASE,
+)
+
+
+def _quick_reject(title: str) -> Optional[ClassificationResult]:
+    """Cheap deterministic pre-filter run before any Gemini call."""
+    if not title.strip():
+        return ClassificationResult(is_relevant=False, reason="Empty title")
+    match = _BLOCKED_TITLE_RE.search(title)
+    if match:
+        return ClassificationResult(
+            is_relevant=False, reason=f"Blocked keyword: {match.group(0).lower()}"
+        )
+    return None
+
+
+def _classifier_prompt(
+    title: str, content: str, media_url: Optional[str], source_type: str
+) -> str:
+    """Format the per-article part of the classifier prompt (content is truncated)."""
+    truncated_content = content[:CLASSIFY_CONTENT_LIMIT]
+    return _render_classifier_article(
+        title=title,
+        content=truncated_content,
+        media_url=media_url or "None",
+        source_type=source_type,
+    )
+
+
+async def refresh_prompt_cache(client: genai.Client, model: str) -> Optional[str]:
+    """
+    Upload CLASSIFIER_RULES to a Gemini context cache (call at start of each fetch cycle).
+    Reuses the current cache until it is close to expiry.
+    Returns the cache name, or None if context caching is unavailable
+    (e.g. the rules are below the model's minimum cacheable size); a failed
+    create isn't retried for PROMPT_CACHE_RETRY_DELAY seconds.
+    """
+    global _prompt_cache_name, _prompt_cache_model, _prompt_cache_expires, _prompt_cache_retry_at
+
+    now = time.time()
+    if (
+        _prompt_cache_name
+        and _prompt_cache_model == model
+        and _prompt_cache_expires - now > PROMPT_CACHE_REFRESH_MARGIN
+    ):
+        return _prompt_cache_name
+    if now < _prompt_cache_retry_at:
+        return None
+
+    try:
+        cache = await client.aio.caches.create(
+            model=model,
+            config=types.CreateCachedContentConfig(
+                contents=[CLASSIFIER_RULES],
+                ttl=f"{PROMPT_CACHE_TTL}s",
+                display_name="classifier-rules",
+            ),
+        )
+    except Exception as e:
+        logger.info(f"Context caching unavailable, sending full prompts: {e}")
+        _prompt_cache_name = None
+        _prompt_cache_retry_at = now + PROMPT_CACHE_RETRY_DELAY
+        return None
+
+    _prompt_cache_name = cache.name
+    _prompt_cache_model = model
+    _prompt_cache_expires = now + PROMPT_CACHE_TTL
+    logger.info(f"Classifier rules cached as {cache.name}")
+    return _prompt_cache_name
+
+
+def _classifier_request(
+    model: str, article_prompt: str
+) -> tuple[str, Optional[types.GenerateContentConfig]]:
+    """
+    Build (contents, config) for a classifier call.
+    Sends only the per-article part when the rules are in a live context cache.
+    """
+    if (
+        _prompt_cache_name
+        and _prompt_cache_model == model
+        and _prompt_cache_expires > time.time()
+    ):
+        return article_prompt, types.GenerateContentConfig(
+            cached_content=_prompt_cache_name
+        )
+    return f"{CLASSIFIER_RULES}\n\n{article_prompt}", None
+
+
 async def classify_article(
     client: genai.Client,
     model: str,
@@ -341,45 +691,80 @@ async def classify_article(
     Classify if article is suitable for the visual-first channel.
     Returns is_relevant=False on any error.
     Uses exponential backoff for rate limits.
+    Successful results are cached by prompt hash and by content embedding
+    (near-duplicate articles reuse the cached verdict).
     """
+    rejected = _quick_reject(title)
+    if rejected:
+        _token_stats.skipped_calls += 1
+        return rejected
+
+    article_prompt = _classifier_prompt(title, content, media_url, source_type)
+
+    cache_key = make_cache_key(model, f"{CLASSIFIER_RULES}\n\n{article_prompt}")
+    # Concurrent callers with the same prompt share one in-flight call
+    return await _inflight.do(
+        cache_key,
+        lambda: _classify_article(
+            client, model, title, content, article_prompt, cache_key
+        ),
+    )
+
+
+async def _classify_article(
+    client: genai.Client,
+    model: str,
+    title: str,
+    content: str,
+    article_prompt: str,
+    cache_key: str,
+) -> ClassificationResult:
+    """Cache lookup + Gemini call behind classify_article."""
     global _consecutive_failures
 
+    cached = await _cached_classification(cache_key)
+    if cached is not None:
+        return cached
+
     if is_circuit_open():
         return ClassificationResult(
             is_relevant=False, reason="Circuit breaker open"
         )
 
-    try:
-        truncated_content = content[:CLASSIFY_CONTENT_LIMIT] if len(content) > CLASSIFY_CONTENT_LIMIT else content
-
-        prompt = CLASSIFIER_PROMPT.format(
-            title=title,
-            content=truncated_content,
-            media_url=media_url or "None",
-            source_type=source_type,
-        )
+    # Reworded copies of an already classified story get the same verdict
+    embedding = await _embed_text(client, f"{title}\n{content[:CLASSIFY_CONTENT_LIMIT]}")
+    if embedding is not None:
+        similar = await asyncio.to_thread(_semantic_cache.lookup, embedding)
+        if similar is not None:
+            logger.debug(f"Semantic cache hit: {title[:50]}")
+            return ClassificationResult(**similar)
+
+        labels = await _get_label_embeddings(client)
+        local = _zero_shot_classify(embedding, labels) if labels else None
+        if local is not None:
+            _token_stats.skipped_calls += 1
+            await _response_cache.set(cache_key, asdict(local))
+            return local
 
+    try:
+        contents, request_config = _classifier_request(model, article_prompt)
         response = await call_with_backoff(
             client.aio.models.generate_content,
             model=model,
-            contents=prompt,
+            contents=contents,
+            config=request_config,
+            estimated_tokens=estimate_tokens(contents),
         )
 
-        _token_stats["classify_calls"] += 1
+        _token_stats.classify_calls += 1
         _log_token_usage(response, "Classification")
         _consecutive_failures = 0  # Reset on success
 
-        # Parse JSON response
-        text = response.text.strip()
-        if text.startswith("```"):
-            text = text.split("```")[1]
-            if text.startswith("json"):
-                text = text[4:]
-        text = text.strip()
-
+        # Parse JSON response (slicing to the outer braces also drops ```json fences)
+        text = _response_text(response).strip()
         try:
-            result = json.loads(text)
-        except json.JSONDecodeError as e:
+            result = orjson.loads(text[text.find("{") : text.rfind("}") + 1])
+        except orjson.JSONDecodeError as e:
             logger.warning(
                 f"Failed to parse classification JSON: {e}. Raw response: {text[:200]}"
             )
@@ -387,10 +772,11 @@ async def classify_article(
                 is_relevant=False, reason=f"JSON parse error: {e}"
             )
 
-        return ClassificationResult(
-            is_relevant=result.get("is_relevant", False),
-            reason=result.get("reason", ""),
-        )
+        classification = _parse_classification(result)
+        await _response_cache.set(cache_key, asdict(classification))
+        if embedding is not None:
+            _semantic_cache.add(embedding, asdict(classification))
+        return classification
 
     except Exception as e:
         _consecutive_failures += 1
@@ -400,6 +786,253 @@ async def classify_article(
         return ClassificationResult(is_relevant=False, reason=f"Error: {e}")
 
 
+async def _embed_texts(
+    client: genai.Client, texts: list[str]
+) -> Optional[list[list[float]]]:
+    """Embed several texts in one call (unit vectors). Returns None on failure."""
+    global _consecutive_failures
+
+    if is_circuit_open():
+        return None
+    try:
+        # Embeddings have their own token quota, so only the request pacing applies
+        response = await call_with_backoff(
+            client.aio.models.embed_content,
+            model=EMBEDDING_MODEL,
+            contents=texts,
+        )
+        _consecutive_failures = 0  # Reset on success
+        return [normalize_vector(e.values) for e in response.embeddings]
+    except Exception as e:
+        _consecutive_failures += 1
+        logger.warning(
+            f"Embedding failed ({_consecutive_failures}/{CIRCUIT_BREAKER_THRESHOLD}), "
+            f"skipping semantic cache: {e}"
+        )
+        return None
+
+
+async def _embed_text(client: genai.Client, text: str) -> Optional[list[float]]:
+    """Embed text for semantic cache lookups. Returns None on failure."""
+    embeddings = await _embed_texts(client, [text])
+    return embeddings[0] if embeddings else None
+
+
+async def _get_label_embeddings(
+    client: genai.Client,
+) -> Optional[tuple[list[list[float]], list[list[float]]]]:
+    """Embed the INCLUDE/EXCLUDE labels once; retried on the next call if it fails."""
+    global _label_embeddings
+
+    if _label_embeddings is None:
+        embeddings = await _embed_texts(client, INCLUDE_LABELS + EXCLUDE_LABELS)
+        if embeddings is not None:
+            split = len(INCLUDE_LABELS)
+            _label_embeddings = (embeddings[:split], embeddings[split:])
+    return _label_embeddings
+
+
+async def _cached_classification(cache_key: str) -> Optional[ClassificationResult]:
+    """Cached classifier verdict, or None on a miss."""
+    cached = await _response_cache.get(cache_key)
+    return ClassificationResult(**cached) if cached is not None else None
+
+
+def _zero_shot_classify(
+    embedding: list[float],
+    labels: tuple[list[list[float]], list[list[float]]],
+    margin: float = ZERO_SHOT_MARGIN,
+) -> Optional[ClassificationResult]:
+    """
+    Reject clear-cut off-topic articles from label similarity alone.
+    Returns None for everything else, which needs the Gemini classifier.
+    """
+    include, exclude = labels
+    include_score = max(sum(map(operator.mul, label, embedding)) for label in include)
+    exclude_score = max(sum(map(operator.mul, label, embedding)) for label in exclude)
+    if exclude_score - include_score > margin:
+        return ClassificationResult(
+            is_relevant=False, reason=f"Zero-shot exclude ({exclude_score:.2f})"
+        )
+    return None
+
+
+async def _classify_chunk(
+    client: genai.Client, model: str, items: list[dict]
+) -> list[Optional[ClassificationResult]]:
+    """
+    Classify up to CLASSIFY_BATCH_SIZE articles with a single Gemini call.
+    Returns results in item order; None marks items that were not classified.
+    """
+    global _consecutive_failures
+
+    if is_circuit_open():
+        return [None] * len(items)
+
+    articles_prompt = _render_classifier_batch(
+        articles=json.dumps(items, ensure_ascii=False, indent=1)
+    )
+
+    try:
+        contents, request_config = _classifier_request(model, articles_prompt)
+        response = await call_with_backoff(
+            client.aio.models.generate_content,
+            model=model,
+            contents=contents,
+            config=request_config,
+            estimated_tokens=estimate_tokens(contents),
+        )
+
+        _token_stats.classify_calls += 1
+        _log_token_usage(response, "Batch classification")
+        _consecutive_failures = 0  # Reset on success
+
+        text = _response_text(response).strip()
+        try:
+            parsed = orjson.loads(text[text.find("[") : text.rfind("]") + 1])
+        except orjson.JSONDecodeError as e:
+            logger.warning(
+                f"Failed to parse batch classification JSON: {e}. Raw response: {text[:200]}"
+            )
+            return await _classify_halves(client, model, items)
+
+    except Exception as e:
+        _consecutive_failures += 1
+        logger.error(
+            f"Batch classification failed ({_consecutive_failures}/{CIRCUIT_BREAKER_THRESHOLD}): {e}"
+        )
+        return [None] * len(items)
+
+    by_id: dict[int, dict] = {}
+    for entry in parsed if isinstance(parsed, list) else []:
+        try:
+            by_id[int(entry["id"])] = entry
+        except (KeyError, TypeError, ValueError):
+            continue
+
+    results: list[Optional[ClassificationResult]] = []
+    for item in items:
+        entry = by_id.get(item["id"])
+        if entry is None:
+            results.append(None)
+            continue
+        results.append(_parse_classification(entry))
+
+    # Ask again for items the model skipped: as a smaller batch, or bisected
+    missing = [n for n, result in enumerate(results) if result is None]
+    if missing:
+        missing_items = [items[n] for n in missing]
+        if len(missing) < len(items):
+            retried = await _classify_chunk(client, model, missing_items)
+        else:
+            retried = await _classify_halves(client, model, missing_items)
+        for n, result in zip(missing, retried):
+            results[n] = result
+    return results
+
+
+async def _classify_halves(
+    client: genai.Client, model: str, items: list[dict]
+) -> list[Optional[ClassificationResult]]:
+    """Retry a batch the model answered unusably as two smaller batches."""
+    if len(items) < 2:
+        return [None] * len(items)
+    mid = len(items) // 2
+    return await _classify_chunk(client, model, items[:mid]) + await _classify_chunk(
+        client, model, items[mid:]
+    )
+
+
+async def classify_articles_batch(
+    client: genai.Client,
+    model: str,
+    articles: list,
+) -> list[Optional[ClassificationResult]]:
+    """
+    Classify several articles, CLASSIFY_BATCH_SIZE per Gemini call.
+    Articles need title, content, image_url and source_type attributes
+    (e.g. FetchedArticle). Results are returned in input order.
+    Quick-rejected, cached (exact or semantic) and clear-cut (zero-shot)
+    rejected articles skip the generate call. Articles left unclassified (API
+    failure or open circuit breaker) are None, so callers can retry them later.
+    """
+    results: list[Optional[ClassificationResult]] = [None] * len(articles)
+    pending: list[tuple[int, str, dict]] = []  # (index, cache_key, item)
+
+    for i, article in enumerate(articles):
+        rejected = _quick_reject(article.title)
+        if rejected:
+            _token_stats.skipped_calls += 1
+            results[i] = rejected
+            continue
+        article_prompt = _classifier_prompt(
+            article.title, article.content, article.image_url, article.source_type
+        )
+        cache_key = make_cache_key(model, f"{CLASSIFIER_RULES}\n\n{article_prompt}")
+        cached = await _cached_classification(cache_key)
+        if cached is not None:
+            results[i] = cached
+            continue
+        pending.append(
+            (
+                i,
+                cache_key,
+                {
+                    "title": article.title,
+                    "content": article.content[:CLASSIFY_CONTENT_LIMIT],
+                    "media_url": article.image_url or "None",
+                    "source_type": article.source_type,
+                },
+            )
+        )
+
+    # One embedding call for the batch: reworded copies of already classified
+    # stories reuse their verdict and clear-cut rejects skip the generate call
+    embeddings = (
+        await _embed_texts(
+            client, [f"{item['title']}\n{item['content']}" for _, _, item in pending]
+        )
+        if pending
+        else None
+    )
+    embedding_of: dict[int, list[float]] = {}  # article index -> embedding
+    if embeddings:
+        labels = await _get_label_embeddings(client)
+        similar = await asyncio.to_thread(
+            lambda: [_semantic_cache.lookup(embedding) for embedding in embeddings]
+        )
+        undecided = []
+        for entry, embedding, hit in zip(pending, embeddings, similar):
+            if hit is not None:
+                logger.debug(f"Semantic cache hit: {articles[entry[0]].title[:50]}")
+                _token_stats.skipped_calls += 1
+                results[entry[0]] = ClassificationResult(**hit)
+                continue
+            local = _zero_shot_classify(embedding, labels) if labels else None
+            if local is not None:
+                _token_stats.skipped_calls += 1
+                await _response_cache.set(entry[1], asdict(local))
+                results[entry[0]] = local
+                continue
+            embedding_of[entry[0]] = embedding
+            undecided.append(entry)
+        pending = undecided
+
+    for start in range(0, len(pending), CLASSIFY_BATCH_SIZE):
+        chunk = pending[start : start + CLASSIFY_BATCH_SIZE]
+        items = [{"id": n, **item} for n, (_, _, item) in enumerate(chunk)]
+        chunk_results = await _classify_chunk(client, model, items)
+        for (i, cache_key, _), result in zip(chunk, chunk_results):
+            if result is None:
+                continue
+            await _response_cache.set(cache_key, asdict(result))
+            if i in embedding_of:
+                _semantic_cache.add(embedding_of[i], asdict(result))
+            results[i] = result
+
+    return results
+
+
 def _detect_mime_type(file_path: str, media_type: str) -> str:
     """Detect MIME type from extension, fallback to video/mp4 or image/jpeg."""
     mime, _ = mimetypes.guess_type(file_path)
@@ -429,6 +1062,21 @@ def _read_media_file(
         return None
 
 
+def _multimodal_contents(
+    prompt: str, media_type: str, media_path: Optional[str]
+) -> list:
+    """Build request contents: attached media (if readable) followed by the prompt."""
+    contents = []
+    if media_path:
+        media_bytes = _read_media_file(media_path)
+        if media_bytes:
+            mime = _detect_mime_type(media_path, media_type)
+            contents.append(types.Part.from_bytes(data=media_bytes, mime_type=mime))
+            logger.debug(f"Sending media to Gemini: {media_path} ({mime})")
+    contents.append(prompt)
+    return contents
+
+
 async def translate_article(
     client: genai.Client,
     model: str,
@@ -444,54 +1092,74 @@ async def translate_article(
     Optionally sends media (image/video) to Gemini for multimodal understanding.
     Returns success=False on any error (never raises).
     Uses exponential backoff for rate limits.
+    Successful results are cached by prompt + media path hash.
 
     Args:
         media_type: "image" or "video" - tells AI what kind of media is attached
         media_path: local path to media file to send alongside text
     """
+    truncated_content = content[:TRANSLATE_CONTENT_LIMIT]
+
+    prompt = _render_translator(
+        title=title,
+        content=truncated_content,
+        source_url=source_url,
+        source_name=source_name,
+        media_type=media_type,
+    )
+
+    # Attached media changes the output, so it is part of the key
+    cache_key = make_cache_key(model, f"{prompt}\0{media_path or ''}")
+    # Concurrent callers with the same prompt and media share one in-flight call
+    return await _inflight.do(
+        cache_key,
+        lambda: _translate_article(
+            client, model, prompt, cache_key, media_type, media_path
+        ),
+    )
+
+
+async def _translate_article(
+    client: genai.Client,
+    model: str,
+    prompt: str,
+    cache_key: str,
+    media_type: str,
+    media_path: Optional[str],
+) -> TranslationResult:
+    """Cache lookup + Gemini call behind translate_article."""
     global _consecutive_failures
 
+    cached = await _response_cache.get(cache_key)
+    if cached is not None:
+        return TranslationResult(**cached)
+
     if is_circuit_open():
         return TranslationResult(
             content="", success=False, error="Circuit breaker open"
         )
 
     try:
-        truncated_content = content[:TRANSLATE_CONTENT_LIMIT] if len(content) > TRANSLATE_CONTENT_LIMIT else content
-
-        prompt = TRANSLATOR_PROMPT.format(
-            title=title,
-            content=truncated_content,
-            source_url=source_url,
-            source_name=source_name,
-            media_type=media_type,
-        )
-
-        contents = []
-        if media_path:
-            media_bytes = _read_media_file(media_path)
-            if media_bytes:
-                mime = _detect_mime_type(media_path, media_type)
-                contents.append(
-                    types.Part.from_bytes(data=media_bytes, mime_type=mime)
-                )
-                logger.debug(f"Sending media to Gemini: {media_path} ({mime})")
-        contents.append(prompt)
+        contents = _multimodal_contents(prompt, media_type, media_path)
 
         response = await call_with_backoff(
             client.aio.models.generate_content,
             model=model,
             contents=contents,
+            estimated_tokens=estimate_tokens(prompt),
+            deadline=MEDIA_CALL_DEADLINE,
         )
 
-        _token_stats["translate_calls"] += 1
+        _token_stats.translate_calls += 1
         _log_token_usage(response, "Translation")
         _consecutive_failures = 0  # Reset on success
 
-        return TranslationResult(
-            content=response.text.strip(),
+        translation = TranslationResult(
+            content=_response_text(response).strip(),
             success=True,
         )
+        await _response_cache.set(cache_key, asdict(translation))
+        return translation
 
     except Exception as e:
         _consecutive_failures += 1
@@ -503,3 +1171,106 @@ async def translate_article(
             success=False,
             error=str(e),
         )
+
+
+async def classify_and_translate(
+    client: genai.Client,
+    model: str,
+    title: str,
+    content: str,
+    source_url: str,
+    source_name: str = "Unknown",
+    media_type: str = "image",
+    media_path: Optional[str] = None,
+    media_url: Optional[str] = None,
+    source_type: str = "rss",
+) -> tuple[ClassificationResult, Optional[TranslationResult]]:
+    """
+    Classify and (if relevant) translate an article with a single Gemini call.
+    Saves one round-trip per accepted article at the cost of sending the
+    translator prompt and media for articles that turn out irrelevant.
+    Returns (classification, translation); translation is None when the
+    article is not relevant. Never raises.
+    """
+    global _consecutive_failures
+
+    rejected = _quick_reject(title)
+    if rejected:
+        _token_stats.skipped_calls += 1
+        return rejected, None
+
+    truncated_content = content[:TRANSLATE_CONTENT_LIMIT]
+    prompt = _render_fused(
+        title=title,
+        content=truncated_content,
+        source_url=source_url,
+        source_name=source_name,
+        media_type=media_type,
+        media_url=media_url or "None",
+        source_type=source_type,
+    )
+
+    cache_key = make_cache_key(model, f"{prompt}\0{media_path or ''}")
+    cached = await _response_cache.get(cache_key)
+    if cached is not None:
+        translation = cached["translation"]
+        return (
+            ClassificationResult(**cached["classification"]),
+            TranslationResult(**translation) if translation else None,
+        )
+
+    if is_circuit_open():
+        return ClassificationResult(is_relevant=False, reason="Circuit breaker open"), None
+
+    try:
+        response = await call_with_backoff(
+            client.aio.models.generate_content,
+            model=model,
+            contents=_multimodal_contents(prompt, media_type, media_path),
+            estimated_tokens=estimate_tokens(prompt),
+            deadline=MEDIA_CALL_DEADLINE,
+        )
+
+        _token_stats.classify_calls += 1
+        _log_token_usage(response, "Classification+translation")
+        _consecutive_failures = 0  # Reset on success
+
+        text = _response_text(response).strip()
+        head, _, post = text.partition(FUSED_SEPARATOR)
+        try:
+            result = orjson.loads(head[head.find("{") : head.rfind("}") + 1])
+        except orjson.JSONDecodeError as e:
+            logger.warning(
+                f"Failed to parse fused classification JSON: {e}. Raw response: {text[:200]}"
+            )
+            return ClassificationResult(
+                is_relevant=False, reason=f"JSON parse error: {e}"
+            ), None
+
+        classification = _parse_classification(result)
+        translation = None
+        if classification.is_relevant:
+            post = post.strip()
+            if not post:
+                # Don't cache: the next attempt may include the post
+                return classification, TranslationResult(
+                    content="", success=False, error="Fused response had no post"
+                )
+            _token_stats.translate_calls += 1
+            translation = TranslationResult(content=post, success=True)
+
+        await _response_cache.set(
+            cache_key,
+            {
+                "classification": asdict(classification),
+                "translation": asdict(translation) if translation else None,
+            },
+        )
+        return classification, translation
+
+    except Exception as e:
+        _consecutive_failures += 1
+        logger.error(
+            f"Classification+translation failed ({_consecutive_failures}/{CIRCUIT_BREAKER_THRESHOLD}): {e}"
+        )
+        return ClassificationResult(is_relevant=False, reason=f"Error: {e}"), None
@@ -0,0 +1,193 @@
+"""Response caches for Gemini calls."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import operator
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Exact-match cache limits
+CACHE_MAX_ENTRIES = 2000
+CACHE_TTL = 7 * 24 * 60 * 60  # 7 days
+
+# Semantic cache settings
+SEMANTIC_THRESHOLD = 0.92  # cosine similarity for a hit
+SEMANTIC_MAX_ENTRIES = 500
+
+
+def make_cache_key(model: str, prompt: str) -> str:
+    """Build a cache key from the model name and the fully formatted prompt."""
+    return hashlib.sha256(f"{model}\0{prompt}".encode()).hexdigest()
+
+
+class LLMCache:
+    """
+    Exact-match LRU cache for Gemini responses with TTL expiry.
+    Values must be JSON-serializable so the cache can be persisted to disk.
+    """
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES, ttl: float = CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # key -> (expires_at, value); wall-clock time so entries survive restarts
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return cached value, or None on miss/expiry."""
+        async with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    async def set(self, key: str, value: Any) -> None:
+        """Store value, evicting least recently used entries over the limit."""
+        async with self._lock:
+            self._entries[key] = (time.time() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def load(self, path: str) -> int:
+        """Load unexpired entries from a JSON file. Returns number loaded."""
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return 0
+        except Exception as e:
+            logger.warning(f"Failed to load LLM cache from {path}: {e}")
+            return 0
+
+        now = time.time()
+        loaded = 0
+        for key, (expires_at, value) in data.items():
+            if expires_at >= now:
+                self._entries[key] = (expires_at, value)
+                loaded += 1
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return loaded
+
+    def save(self, path: str) -> int:
+        """Write unexpired entries to a JSON file atomically. Returns number saved."""
+        now = time.time()
+        data = {k: v for k, v in self._entries.items() if v[0] >= now}
+        tmp_path = f"{path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Failed to save LLM cache to {path}: {e}")
+            return 0
+        return len(data)
+
+
+def normalize_vector(values) -> list[float]:
+    """Scale a vector to unit length so dot product equals cosine similarity."""
+    norm = math.sqrt(sum(v * v for v in values))
+    if norm == 0:
+        return list(values)
+    return [v / norm for v in values]
+
+
+class SemanticCache:
+    """
+    Near-duplicate cache over unit-length embeddings.
+    Returns the stored value of the most similar entry above the threshold.
+    """
+
+    def __init__(
+        self,
+        threshold: float = SEMANTIC_THRESHOLD,
+        max_entries: int = SEMANTIC_MAX_ENTRIES,
+    ):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        # (vector, value) pairs, so a snapshot of both is one atomic copy
+        self._entries: list[tuple[list[float], Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, embedding: list[float]) -> Optional[Any]:
+        """
+        Return value of the best match with similarity >= threshold, else None.
+        CPU-bound (one dot product per entry): call it via asyncio.to_thread.
+        """
+        best_score = self.threshold
+        best_value = None
+        for vector, value in tuple(self._entries):
+            score = sum(map(operator.mul, vector, embedding))
+            if score >= best_score:
+                best_score = score
+                best_value = value
+        return best_value
+
+    def add(self, embedding: list[float], value: Any) -> None:
+        """Store an embedding/value pair, dropping the oldest entry over the limit."""
+        self._entries.append((embedding, value))
+        if len(self._entries) > self.max_entries:
+            del self._entries[0]
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls with the same key into one in-flight task.
+    Late callers await the running task instead of starting their own.
+    With cancel_abandoned, the task is cancelled once every caller waiting on
+    it has been cancelled; otherwise it always runs to completion.
+    """
+
+    def __init__(self, cancel_abandoned: bool = False):
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._waiters: dict[asyncio.Task, int] = {}
+        self._cancel_abandoned = cancel_abandoned
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def do(self, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        """Run factory() for key unless a call for key is already in flight."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            # Shield so one cancelled caller doesn't cancel the call for the others
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if self._cancel_abandoned and self._waiters[task] == 1:
+                self._forget(key, task)
+                task.cancel()
+            raise
+        finally:
+            self._waiters[task] -= 1
+            if not self._waiters[task]:
+                del self._waiters[task]
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
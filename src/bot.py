@@ -1,24 +1,40 @@
 """Telegram bot handlers and publishing."""
 
 import asyncio
+import html
 import logging
-from typing import TYPE_CHECKING, Optional
-
-from telegram import Bot, InlineKeyboardButton, InlineKeyboardMarkup, Update
+import re
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional, TypeVar
+
+from telegram import (
+    Bot,
+    InlineKeyboardButton,
+    InlineKeyboardMarkup,
+    InputMediaPhoto,
+    Update,
+)
+from telegram.error import BadRequest, RetryAfter
 from telegram.ext import (
     Application,
     CallbackQueryHandler,
     CommandHandler,
     ContextTypes,
 )
+from telegram.request import HTTPXRequest
 
 from .database import (
     Article,
-    get_approved_count,
     get_article_by_id,
     get_pending_articles,
     get_pending_count,
-    update_article_status,
+    get_status_counts,
+    set_article_file_id,
+    transaction,
+    update_article_statuses,
 )
 
 if TYPE_CHECKING:
@@ -26,9 +42,28 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# The admin, precomputed by create_bot for the per-update authorization check
+_authorized_ids: frozenset[int] = frozenset()
+
 MAX_MESSAGE_LENGTH = 4000
 MAX_CAPTION_LENGTH = 1024
 MAX_RESEND = 10
+MEDIA_GROUP_SIZE = 10  # Telegram's limit per media group
+TELEGRAM_POOL_SIZE = 16
+TELEGRAM_READ_TIMEOUT = 30.0  # seconds
+TELEGRAM_MEDIA_WRITE_TIMEOUT = 60.0  # seconds, video uploads can be large
+ARTICLE_CACHE_SIZE = 512  # articles kept in memory for approval button presses
+STATUS_FLUSH_INTERVAL = 0.05  # seconds approval status updates are batched for
+RESEND_CONCURRENCY = 5  # parallel approval sends; flood limits are waited out
+
+
+# Approval button callback data: "approve:<id>" or "reject:<id>"
+APPROVAL_CALLBACK_RE = re.compile(r"^(approve|reject):(\d+)$")
+
+_OPEN_TAG_RE = re.compile(r"<([a-zA-Z]+)[^>]*>")
+_CLOSE_TAG_RE = re.compile(r"</([a-zA-Z]+)>")
 
 
 def truncate(text: str, max_length: int) -> str:
@@ -40,8 +75,6 @@ def truncate(text: str, max_length: int) -> str:
     if len(text) <= max_length:
         return text
 
-    import re  # noqa: PLC0415 - local import for rarely-used function
-
     # Reserve space for closing tags and ellipsis
     # Worst case: 3-4 nested tags like </code></pre></b></a> = ~30 chars + "..." = ~33
     reserve = 40
@@ -49,14 +82,14 @@ def truncate(text: str, max_length: int) -> str:
 
     # Find all opening tags (including self-closing detection)
     open_tags = []
-    for match in re.finditer(r"<([a-zA-Z]+)[^>]*>", truncated):
+    for match in _OPEN_TAG_RE.finditer(truncated):
         tag = match.group(1).lower()
         # Skip self-closing or void elements
         if tag not in ("br", "hr", "img", "input", "meta", "link"):
             open_tags.append(tag)
 
     # Remove tags that were closed
-    for match in re.finditer(r"</([a-zA-Z]+)>", truncated):
+    for match in _CLOSE_TAG_RE.finditer(truncated):
         tag = match.group(1).lower()
         if tag in open_tags:
             open_tags.remove(tag)
@@ -80,6 +113,36 @@ def truncate(text: str, max_length: int) -> str:
     return truncated + suffix
 
 
+async def _flood_retry(send: Callable[[], Awaitable[T]]) -> T:
+    """Run a Telegram send, waiting out one flood-control RetryAfter."""
+    try:
+        return await send()
+    except RetryAfter as e:
+        logger.warning(f"Telegram flood limit hit, retrying in {e.retry_after}s")
+        await asyncio.sleep(e.retry_after)
+        return await send()
+
+
+async def _read_file(path: str) -> Optional[bytes]:
+    """Read a media file in a worker thread. Returns None if it can't be read."""
+    try:
+        return await asyncio.to_thread(Path(path).read_bytes)
+    except OSError as e:
+        logger.warning(f"Failed to read media file {path}: {e}")
+        return None
+
+
+async def _load_photo(article: Article) -> Optional[str | bytes]:
+    """Photo to send for an article: stored file_id, local file bytes or URL."""
+    if article.telegram_file_id:
+        return article.telegram_file_id
+    if article.local_image_path:
+        photo = await _read_file(article.local_image_path)
+        if photo is not None:
+            return photo
+    return article.image_url
+
+
 async def _send_with_media(
     bot: Bot,
     chat_id,
@@ -94,21 +157,30 @@ async def _send_with_media(
     """
     media_failed = False
     media_error = None
+    has_video = article.media_type == "video" and article.local_video_path
+    # A file_id from an earlier upload skips re-uploading the image
+    image_source = article.telegram_file_id or article.local_image_path or article.image_url
+    # Caption is truncated once and shared by the video/photo attempts;
+    # text-only articles never need it
+    caption = truncate(content, MAX_CAPTION_LENGTH) if has_video or image_source else ""
 
     # Try video if available
-    if article.media_type == "video" and article.local_video_path:
+    if has_video:
         try:
-            with open(article.local_video_path, "rb") as video_file:
-                sent_message = await bot.send_video(
-                    chat_id=chat_id,
-                    video=video_file,
-                    caption=truncate(content, MAX_CAPTION_LENGTH),
-                    parse_mode=parse_mode,
-                    reply_markup=reply_markup,
-                    supports_streaming=True,
-                    width=article.video_width,
-                    height=article.video_height,
-                )
+            async def send_video():
+                with open(article.local_video_path, "rb") as video_file:
+                    return await bot.send_video(
+                        chat_id=chat_id,
+                        video=video_file,
+                        caption=caption,
+                        parse_mode=parse_mode,
+                        reply_markup=reply_markup,
+                        supports_streaming=True,
+                        width=article.video_width,
+                        height=article.video_height,
+                    )
+
+            sent_message = await _flood_retry(send_video)
             # Verify Telegram actually processed the video
             if sent_message and sent_message.video:
                 return True, False, None
@@ -123,26 +195,37 @@ async def _send_with_media(
             logger.warning(f"Video send failed for article {article.id}: {e}")
 
     # Try image if available
-    image_source = article.local_image_path or article.image_url
     if image_source and (not media_failed or article.media_type == "video"):
         try:
-            if article.local_image_path:
-                with open(article.local_image_path, "rb") as photo_file:
-                    await bot.send_photo(
-                        chat_id=chat_id,
-                        photo=photo_file,
-                        caption=truncate(content, MAX_CAPTION_LENGTH),
-                        parse_mode=parse_mode,
-                        reply_markup=reply_markup,
-                    )
-            else:
-                await bot.send_photo(
+            photo_bytes = None  # read at most once, reused by flood retries
+
+            async def send_photo():
+                nonlocal photo_bytes
+                if article.telegram_file_id:
+                    try:
+                        return await bot.send_photo(
+                            chat_id=chat_id,
+                            photo=article.telegram_file_id,
+                            caption=caption,
+                            parse_mode=parse_mode,
+                            reply_markup=reply_markup,
+                        )
+                    except BadRequest as e:
+                        logger.warning(f"Stored file_id rejected for article {article.id}: {e}")
+                        article.telegram_file_id = None
+                if photo_bytes is None and article.local_image_path:
+                    photo_bytes = await _read_file(article.local_image_path)
+                return await bot.send_photo(
                     chat_id=chat_id,
-                    photo=article.image_url,
-                    caption=truncate(content, MAX_CAPTION_LENGTH),
+                    photo=photo_bytes or article.image_url,
+                    caption=caption,
                     parse_mode=parse_mode,
                     reply_markup=reply_markup,
                 )
+
+            sent_message = await _flood_retry(send_photo)
+            if sent_message and sent_message.photo:
+                article.telegram_file_id = sent_message.photo[-1].file_id
             return True, False, None
         except Exception as e:
             media_failed = True
@@ -151,12 +234,14 @@ async def _send_with_media(
 
     # Text-only fallback
     try:
-        await bot.send_message(
-            chat_id=chat_id,
-            text=truncate(content, MAX_MESSAGE_LENGTH),
-            parse_mode=parse_mode,
-            reply_markup=reply_markup,
-            disable_web_page_preview=True,
+        await _flood_retry(
+            lambda: bot.send_message(
+                chat_id=chat_id,
+                text=truncate(content, MAX_MESSAGE_LENGTH),
+                parse_mode=parse_mode,
+                reply_markup=reply_markup,
+                disable_web_page_preview=True,
+            )
         )
         return True, media_failed, media_error
     except Exception as e:
@@ -164,8 +249,30 @@ async def _send_with_media(
         return False, media_failed, media_error
 
 
-async def send_approval_request(bot: Bot, admin_id: int, article: Article) -> None:
-    """Send article to admin for approval with media preview."""
+_APPROVAL_TEMPLATE = """🆕 <b>Yangi hikoya topildi!</b> {media_indicator}
+
+📰 <b>Original:</b> {title}{summary}
+
+━━━━━━━━━━━━━━━
+
+🇺🇿 <b>Telegram uchun:</b>
+
+{preview}"""
+
+_APPROVED_TEMPLATE = "✅ <b>Tasdiqlandi</b>\n\n📰 {title}\n\nNashr qilish navbatiga qo'shildi."
+_REJECTED_TEMPLATE = "❌ <b>Rad etildi</b>\n\n📰 {title}"
+
+_START_TEXT = (
+    "👋 Salom! Men Olamda nima gap? botiman.\n\n"
+    "Buyruqlar:\n"
+    "/status - Statistika\n"
+    "/fetch - Yangi hikoyalarni qidirish\n"
+    "/resend - Kutilayotgan hikoyalarni qayta yuborish"
+)
+
+
+def _approval_message(article: Article) -> str:
+    """Build the admin approval preview text for an article."""
     uzbek_preview = truncate(article.uzbek_content or "", 1500)
     media_indicator = "🎬" if article.media_type == "video" else "🖼"
 
@@ -177,36 +284,106 @@ async def send_approval_request(bot: Bot, admin_id: int, article: Article) -> No
         if not article.original_title.strip().startswith(
             article.original_summary.strip()[:50]
         ):
-            summary_text = f"\n\n{truncate(article.original_summary, 500)}"
-
-    message = f"""🆕 <b>Yangi hikoya topildi!</b> {media_indicator}
+            summary_text = f"\n\n{html.escape(truncate(article.original_summary, 500))}"
 
-📰 <b>Original:</b> {article.original_title}{summary_text}
-
-━━━━━━━━━━━━━━━
-
-🇺🇿 <b>Telegram uchun:</b>
+    return _APPROVAL_TEMPLATE.format(
+        media_indicator=media_indicator,
+        title=html.escape(article.original_title),
+        summary=summary_text,
+        preview=uzbek_preview,
+    )
 
-{uzbek_preview}"""
 
-    keyboard = InlineKeyboardMarkup(
+@lru_cache(maxsize=1024)
+def _approval_keyboard(article_id: int) -> InlineKeyboardMarkup:
+    """Approve/reject buttons for one article (PTB markups are immutable, so shared)."""
+    return InlineKeyboardMarkup(
         [
             [
                 InlineKeyboardButton(
-                    "✅ Tasdiqlash", callback_data=f"approve:{article.id}"
+                    "✅ Tasdiqlash", callback_data=f"approve:{article_id}"
                 ),
                 InlineKeyboardButton(
-                    "❌ Rad etish", callback_data=f"reject:{article.id}"
+                    "❌ Rad etish", callback_data=f"reject:{article_id}"
                 ),
             ]
         ]
     )
 
+
+async def send_approval_request(bot: Bot, admin_id: int, article: Article) -> bool:
+    """Send article to admin for approval with media preview. Returns True on success."""
     success, _, _ = await _send_with_media(
-        bot, admin_id, article, message, reply_markup=keyboard
+        bot,
+        admin_id,
+        article,
+        _approval_message(article),
+        reply_markup=_approval_keyboard(article.id),
     )
     if not success:
         logger.error(f"Failed to send approval request for article {article.id}")
+    return success
+
+
+async def send_approval_batch(bot: Bot, admin_id: int, articles: list[Article]) -> int:
+    """
+    Send up to MEDIA_GROUP_SIZE image articles as one media group, followed by
+    a single message with approve/reject buttons for each of them (media groups
+    can't carry inline keyboards). Falls back to one request per article only
+    if the media group itself fails. Returns number of articles sent with
+    buttons.
+    """
+    articles = articles[:MEDIA_GROUP_SIZE]
+    try:
+        photos = await asyncio.gather(*(_load_photo(a) for a in articles))
+        media = [
+            InputMediaPhoto(
+                media=photo,
+                caption=truncate(_approval_message(a), MAX_CAPTION_LENGTH),
+                parse_mode="HTML",
+            )
+            for a, photo in zip(articles, photos)
+        ]
+        messages = await _flood_retry(
+            lambda: bot.send_media_group(chat_id=admin_id, media=media)
+        )
+    except Exception as e:
+        logger.warning(f"Media group send failed, sending one by one: {e}")
+        sent = 0
+        for article in articles:
+            if await send_approval_request(bot, admin_id, article):
+                sent += 1
+        return sent
+
+    for article, message in zip(articles, messages):
+        if message.photo:
+            article.telegram_file_id = message.photo[-1].file_id
+
+    # The previews are already out: a failure here must not resend them
+    lines = ["👆 <b>Hikoyalarni tanlang:</b>"]
+    rows = []
+    for a in articles:
+        lines.append(f"#{a.id} {html.escape(truncate(a.original_title, 60))}")
+        rows.append(
+            [
+                InlineKeyboardButton(f"✅ #{a.id}", callback_data=f"approve:{a.id}"),
+                InlineKeyboardButton(f"❌ #{a.id}", callback_data=f"reject:{a.id}"),
+            ]
+        )
+    try:
+        await _flood_retry(
+            lambda: bot.send_message(
+                chat_id=admin_id,
+                text="\n".join(lines),
+                parse_mode="HTML",
+                reply_markup=InlineKeyboardMarkup(rows),
+            )
+        )
+    except Exception as e:
+        # Left pending without buttons; /resend offers them again
+        logger.error(f"Failed to send approval buttons for media group: {e}")
+        return 0
+    return len(articles)
 
 
 async def publish_article(
@@ -230,7 +407,7 @@ async def publish_article(
             await bot.send_message(
                 chat_id=admin_id,
                 text=f"⚠️ <b>{media_type_label} yuborilmadi</b>\n\n"
-                f"📰 {truncate(article.original_title, 100)}\n"
+                f"📰 {html.escape(truncate(article.original_title, 100))}\n"
                 f"❌ {truncate(media_error or 'Unknown error', 200)}\n\n"
                 f"Hikoya mediasiz nashr qilindi.",
                 parse_mode="HTML",
@@ -266,24 +443,19 @@ async def send_fetch_summary(
     if new_articles == 0 and failed == 0:
         return  # Nothing interesting to report
 
-    parts = []
-    parts.append("📊 <b>Qidiruv yakunlandi</b>\n")
-
-    if new_articles > 0:
-        parts.append(f"✅ Yangi hikoyalar: {new_articles}")
-    if skipped_duplicates > 0:
-        parts.append(f"🔄 Takroriy: {skipped_duplicates}")
-    if skipped_irrelevant > 0:
-        parts.append(f"⏭ O'tkazib yuborildi: {skipped_irrelevant}")
-    if failed > 0:
-        parts.append(f"❌ Xatolik: {failed}")
-    if remaining > 0:
-        parts.append(f"⏳ Keyingi safar: {remaining}")
+    text = (
+        "📊 <b>Qidiruv yakunlandi</b>\n"
+        + (f"\n✅ Yangi hikoyalar: {new_articles}" if new_articles > 0 else "")
+        + (f"\n🔄 Takroriy: {skipped_duplicates}" if skipped_duplicates > 0 else "")
+        + (f"\n⏭ O'tkazib yuborildi: {skipped_irrelevant}" if skipped_irrelevant > 0 else "")
+        + (f"\n❌ Xatolik: {failed}" if failed > 0 else "")
+        + (f"\n⏳ Keyingi safar: {remaining}" if remaining > 0 else "")
+    )
 
     try:
         await bot.send_message(
             chat_id=admin_id,
-            text="\n".join(parts),
+            text=text,
             parse_mode="HTML",
         )
     except Exception as e:
@@ -295,28 +467,21 @@ async def send_fetch_summary(
 
 async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /start command."""
-    admin_id = context.bot_data.get("admin_id")
-    if update.effective_user.id != admin_id:
+    if update.effective_user.id not in _authorized_ids:
         return
 
-    await update.message.reply_text(
-        "👋 Salom! Men Olamda nima gap? botiman.\n\n"
-        "Buyruqlar:\n"
-        "/status - Statistika\n"
-        "/fetch - Yangi hikoyalarni qidirish\n"
-        "/resend - Kutilayotgan hikoyalarni qayta yuborish"
-    )
+    await update.message.reply_text(_START_TEXT)
 
 
 async def status_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /status command."""
-    admin_id = context.bot_data.get("admin_id")
-    if update.effective_user.id != admin_id:
+    if update.effective_user.id not in _authorized_ids:
         return
 
-    conn = context.bot_data.get("db_conn")
-    pending = get_pending_count(conn)
-    approved = get_approved_count(conn)
+    conn = context.bot_data["state"].db_conn
+    counts = await asyncio.to_thread(get_status_counts, conn)
+    pending = counts.get("pending", 0)
+    approved = counts.get("approved", 0)
 
     await update.message.reply_text(
         f"📊 <b>Status</b>\n\n⏳ Kutilmoqda: {pending}\n✅ Tasdiqlangan: {approved}",
@@ -326,96 +491,205 @@ async def status_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 
 async def fetch_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /fetch command - trigger manual fetch."""
-    admin_id = context.bot_data.get("admin_id")
-    if update.effective_user.id != admin_id:
+    if update.effective_user.id not in _authorized_ids:
         return
 
     await update.message.reply_text("🔄 Yangi hikoyalar qidirilmoqda...")
 
     # Set flag for fetch job to run immediately
-    context.bot_data["fetch_now"] = True
+    context.bot_data["state"].fetch_now.set()
 
 
 async def resend_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /resend command - resend pending articles for approval (max 10 at a time)."""
-    admin_id = context.bot_data.get("admin_id")
-    if update.effective_user.id != admin_id:
+    if update.effective_user.id not in _authorized_ids:
         return
+    state: BotState = context.bot_data["state"]
+    admin_id = state.admin_id
+    conn = state.db_conn
 
-    conn = context.bot_data.get("db_conn")
-    pending = get_pending_articles(conn)
+    # Only the rows being sent are materialized; the rest are just counted
+    pending_count = await asyncio.to_thread(get_pending_count, conn)
 
-    if not pending:
+    if not pending_count:
         await update.message.reply_text("📭 Kutilayotgan hikoyalar yo'q")
         return
 
-    to_send = pending[:MAX_RESEND]
-    remaining = len(pending) - len(to_send)
+    to_send = await asyncio.to_thread(get_pending_articles, conn, MAX_RESEND)
+    remaining = pending_count - len(to_send)
 
     await update.message.reply_text(
         f"📤 {len(to_send)} ta hikoya yuborilmoqda..."
         + (f" ({remaining} ta keyinroq)" if remaining > 0 else "")
     )
 
-    sent = 0
+    # Image previews go out as one media group; videos and text-only articles
+    # are sent individually in parallel
+    grouped, single = [], []
+    for article in to_send:
+        if article.media_type != "video" and (article.local_image_path or article.image_url):
+            grouped.append(article)
+        else:
+            single.append(article)
+    if len(grouped) < 2:  # a group of one is just a plain request
+        single, grouped = to_send, []
+
+    semaphore = asyncio.Semaphore(RESEND_CONCURRENCY)
+
+    async def resend_one(article: Article) -> bool:
+        async with semaphore:
+            try:
+                return await send_approval_request(context.bot, admin_id, article)
+            except Exception as e:
+                logger.error(f"Failed to resend article {article.id}: {e}")
+                return False
+
+    known_file_ids = {a.id: a.telegram_file_id for a in to_send}
+    sent = sum(await asyncio.gather(*(resend_one(a) for a in single)))
+    if grouped:
+        sent += await send_approval_batch(context.bot, admin_id, grouped)
+
+    # Approval button presses read these back instead of querying SQLite
+    cache = state.article_cache
     for article in to_send:
+        cache[article.id] = article
+        cache.move_to_end(article.id)
+    while len(cache) > ARTICLE_CACHE_SIZE:
+        cache.popitem(last=False)
+
+    # Remember uploaded photos so publishing reuses them instead of re-uploading
+    new_file_ids = [
+        (a.id, a.telegram_file_id)
+        for a in to_send
+        if a.telegram_file_id and a.telegram_file_id != known_file_ids[a.id]
+    ]
+    if new_file_ids:
+        await _save_file_ids(conn, state.db_lock, new_file_ids)
+
+    await update.message.reply_text(f"✅ {sent}/{len(to_send)} ta hikoya yuborildi")
+
+
+def _store_file_ids(conn, file_ids: list[tuple[int, str]]) -> None:
+    """Write photo file_ids with a single commit."""
+    with transaction(conn):
+        for article_id, file_id in file_ids:
+            set_article_file_id(conn, article_id, file_id, commit=False)
+
+
+async def _save_file_ids(conn, db_lock, file_ids: list[tuple[int, str]]) -> None:
+    """Persist photo file_ids in a worker thread, under db_lock when given."""
+    try:
+        if db_lock:
+            async with db_lock:
+                await asyncio.to_thread(_store_file_ids, conn, file_ids)
+        else:
+            await asyncio.to_thread(_store_file_ids, conn, file_ids)
+    except Exception as e:
+        logger.warning(f"Failed to save Telegram file ids: {e}")
+
+
+class StatusWriter:
+    """
+    Coalesces article status updates from approval buttons into one commit
+    per STATUS_FLUSH_INTERVAL, so bursts of button presses don't each wait
+    for their own commit. Call close() before closing the connection.
+    """
+
+    def __init__(self, conn, db_lock: "asyncio.Lock | None" = None):
+        self._conn = conn
+        self._db_lock = db_lock
+        self._queue: asyncio.Queue[Optional[tuple[int, str]]] = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def submit(self, article_id: int, status: str) -> None:
+        """Queue a status update; the background writer commits it shortly."""
+        self._queue.put_nowait((article_id, status))
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        closing = False
+        while not closing:
+            updates = [await self._queue.get()]
+            if updates[0] is not None:
+                await asyncio.sleep(STATUS_FLUSH_INTERVAL)  # let a burst accumulate
+            while not self._queue.empty():
+                updates.append(self._queue.get_nowait())
+            closing = None in updates  # sentinel from close()
+            await self._write([u for u in updates if u is not None])
+
+    async def _write(self, updates: list[tuple[int, str]]) -> None:
+        if not updates:
+            return
         try:
-            await send_approval_request(context.bot, admin_id, article)
-            sent += 1
-            # Longer delay to avoid flooding
-            await asyncio.sleep(1.0)
+            if self._db_lock:
+                async with self._db_lock:
+                    await asyncio.to_thread(update_article_statuses, self._conn, updates)
+            else:
+                await asyncio.to_thread(update_article_statuses, self._conn, updates)
         except Exception as e:
-            logger.error(f"Failed to resend article {article.id}: {e}")
+            logger.error(f"Failed to write {len(updates)} article status updates: {e}")
 
-    await update.message.reply_text(f"✅ {sent}/{len(to_send)} ta hikoya yuborildi")
+    async def close(self) -> None:
+        """Commit anything still queued and stop the background writer."""
+        if self._task is not None and not self._task.done():
+            self._queue.put_nowait(None)
+            await self._task
+        self._task = None
 
 
 async def approval_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle approval/rejection button callbacks."""
     query = update.callback_query
-    admin_id = context.bot_data.get("admin_id")
-
-    if query.from_user.id != admin_id:
+    if query.from_user.id not in _authorized_ids:
         await query.answer("Ruxsat yo'q")
         return
 
     await query.answer()
 
-    # Parse callback data with validation
-    try:
-        action, article_id_str = query.data.split(":", 1)
-        article_id = int(article_id_str)
-    except (ValueError, AttributeError) as e:
-        logger.warning(f"Invalid callback data '{query.data}': {e}")
-        await query.answer("❌ Noto'g'ri ma'lumot", show_alert=True)
-        return
+    # Callback data was validated by the handler's APPROVAL_CALLBACK_RE pattern
+    match = context.matches[0]
+    action, article_id = match.group(1), int(match.group(2))
 
-    conn = context.bot_data.get("db_conn")
-    db_lock = context.bot_data.get("db_lock")
-    article = get_article_by_id(conn, article_id)
+    state: BotState = context.bot_data["state"]
+    # Popped, not read: the status changes below, so the cached copy goes stale
+    article = state.article_cache.pop(article_id, None)
+    if article is None:
+        article = await asyncio.to_thread(get_article_by_id, state.db_conn, article_id)
 
     if not article:
         await query.answer("❌ Hikoya topilmadi", show_alert=True)
         return
 
     if action == "approve":
-        if db_lock:
-            async with db_lock:
-                update_article_status(conn, article_id, "approved")
-        else:
-            update_article_status(conn, article_id, "approved")
-        response_text = (
-            f"✅ <b>Tasdiqlandi</b>\n\n"
-            f"📰 {article.original_title}\n\n"
-            f"Nashr qilish navbatiga qo'shildi."
-        )
+        state.status_writer.submit(article_id, "approved")
+        response_text = _APPROVED_TEMPLATE.format(title=html.escape(article.original_title))
     else:  # reject
-        if db_lock:
-            async with db_lock:
-                update_article_status(conn, article_id, "rejected")
-        else:
-            update_article_status(conn, article_id, "rejected")
-        response_text = f"❌ <b>Rad etildi</b>\n\n📰 {article.original_title}"
+        state.status_writer.submit(article_id, "rejected")
+        response_text = _REJECTED_TEMPLATE.format(title=html.escape(article.original_title))
+
+    # Batch keyboards (send_approval_batch) label buttons with "#<id>": mark
+    # this one as done and keep the buttons for the rest, down to the last row
+    markup = query.message.reply_markup
+    if markup and any(
+        f"#{article_id}" in button.text for row in markup.inline_keyboard for button in row
+    ):
+        rows = [
+            row
+            for row in markup.inline_keyboard
+            if not any(b.callback_data.endswith(f":{article_id}") for b in row)
+        ]
+        status_line = (
+            f"✅ #{article_id} Tasdiqlandi"
+            if action == "approve"
+            else f"❌ #{article_id} Rad etildi"
+        )
+        await query.edit_message_text(
+            text=f"{query.message.text_html}\n{status_line}",
+            parse_mode="HTML",
+            reply_markup=InlineKeyboardMarkup(rows) if rows else None,
+        )
+        return
 
     # Use appropriate edit method based on message type
     # Media messages (photo/video) have captions, text messages have text
@@ -433,6 +707,21 @@ async def approval_callback(update: Update, context: ContextTypes.DEFAULT_TYPE)
         )
 
 
+@dataclass(slots=True)
+class BotState:
+    """Shared handler state, stored once in bot_data["state"] by create_bot."""
+
+    admin_id: int
+    channel_id: str
+    db_conn: "sqlite3.Connection"
+    db_lock: "asyncio.Lock | None"
+    status_writer: StatusWriter
+    # Set by /fetch; the scheduler waits on it to fetch right away
+    fetch_now: asyncio.Event = field(default_factory=asyncio.Event)
+    # article_id -> Article for approval button presses
+    article_cache: OrderedDict = field(default_factory=OrderedDict)
+
+
 def create_bot(
     token: str,
     admin_id: int,
@@ -441,20 +730,33 @@ def create_bot(
     db_lock: "asyncio.Lock | None" = None,
 ) -> Application:
     """Create and configure Telegram bot application."""
-    app = Application.builder().token(token).build()
+    global _authorized_ids
+
+    # HTTP/2 lets concurrent sends (resend fan-out, media groups) share one
+    # TLS connection to api.telegram.org; long polling keeps PTB's default
+    request = HTTPXRequest(
+        connection_pool_size=TELEGRAM_POOL_SIZE,
+        http_version="2",
+        read_timeout=TELEGRAM_READ_TIMEOUT,
+        media_write_timeout=TELEGRAM_MEDIA_WRITE_TIMEOUT,
+    )
+    app = Application.builder().token(token).request(request).build()
+    _authorized_ids = frozenset({admin_id})
 
     # Store shared data
-    app.bot_data["admin_id"] = admin_id
-    app.bot_data["channel_id"] = channel_id
-    app.bot_data["db_conn"] = db_conn
-    app.bot_data["db_lock"] = db_lock
-    app.bot_data["fetch_now"] = False
+    app.bot_data["state"] = BotState(
+        admin_id=admin_id,
+        channel_id=channel_id,
+        db_conn=db_conn,
+        db_lock=db_lock,
+        status_writer=StatusWriter(db_conn, db_lock),
+    )
 
     # Register handlers
     app.add_handler(CommandHandler("start", start_command))
     app.add_handler(CommandHandler("status", status_command))
     app.add_handler(CommandHandler("fetch", fetch_command))
     app.add_handler(CommandHandler("resend", resend_command))
-    app.add_handler(CallbackQueryHandler(approval_callback))
+    app.add_handler(CallbackQueryHandler(approval_callback, pattern=APPROVAL_CALLBACK_RE))
 
     return app
@@ -2,11 +2,20 @@
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping
 
 import yaml
 from dotenv import load_dotenv
 
+# libyaml's C loader when PyYAML was built with it, pure-Python otherwise
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 def _parse_int_env(name: str, default: int) -> int:
     """Parse an integer from environment variable with clear error message."""
@@ -19,7 +28,20 @@ def _parse_int_env(name: str, default: int) -> int:
         raise ValueError(f"Invalid integer for {name}: '{value}'") from None
 
 
-@dataclass
+def _parse_bool_env(name: str, default: bool) -> bool:
+    """Parse a boolean flag (1/true/yes/on, 0/false/no/off) from environment variable."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    lowered = value.strip().lower()
+    if lowered in ("1", "true", "yes", "on"):
+        return True
+    if lowered in ("0", "false", "no", "off"):
+        return False
+    raise ValueError(f"Invalid boolean for {name}: '{value}'")
+
+
+@dataclass(frozen=True)
 class Config:
     """Application configuration."""
 
@@ -41,13 +63,18 @@ class Config:
     # Processing limits
     max_new_articles_per_fetch: int
 
-    # Sources from YAML
-    sources: list[dict]
+    # Classify + translate in one Gemini call (download media before classifying)
+    fuse_classify_translate: bool
+
+    # Sources from YAML (read-only, the config is shared via the load_config cache)
+    sources: tuple[Mapping[str, Any], ...]
 
 
+@lru_cache(maxsize=1)
 def load_config() -> Config:
     """
     Load configuration from .env and sources.yaml.
+    Parsed once per process; later calls return the same Config.
 
     Raises:
         KeyError: If required environment variables are missing.
@@ -58,7 +85,7 @@ def load_config() -> Config:
     # Load and validate sources.yaml
     sources_path = Path(__file__).parent.parent / "config" / "sources.yaml"
     with open(sources_path) as f:
-        sources_data = yaml.safe_load(f)
+        sources_data = yaml.load(f, Loader=_YamlLoader)
     if not isinstance(sources_data, dict) or "sources" not in sources_data:
         raise ValueError(
             f"Invalid sources.yaml: expected a dict with 'sources' key, got {type(sources_data).__name__}"
@@ -87,5 +114,6 @@ def load_config() -> Config:
         publish_gap_minutes=_parse_int_env("PUBLISH_GAP_MINUTES", 60),
         log_level=os.getenv("LOG_LEVEL", "INFO"),
         max_new_articles_per_fetch=_parse_int_env("MAX_NEW_ARTICLES_PER_FETCH", 10),
-        sources=sources_data.get("sources", []),
+        fuse_classify_translate=_parse_bool_env("FUSE_CLASSIFY_TRANSLATE", False),
+        sources=tuple(MappingProxyType(source) for source in sources_data["sources"]),
     )
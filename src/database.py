@@ -1,16 +1,18 @@
 """SQLite database connection and operations."""
 
 import hashlib
-import re
 import sqlite3
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from difflib import SequenceMatcher
-from typing import Optional
+from functools import lru_cache
+from itertools import islice
+from typing import Iterator, Optional
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
 
-@dataclass
+@dataclass(slots=True)
 class Article:
     """Article record from database."""
 
@@ -32,8 +34,30 @@ class Article:
     video_width: Optional[int] = None
     video_height: Optional[int] = None
     publish_fail_count: int = 0
+    telegram_file_id: Optional[str] = None  # photo file_id from the first upload
 
 
+# Article columns in dataclass field order, so rows construct Article positionally
+_ARTICLE_COLUMNS = ", ".join(Article.__dataclass_fields__)
+
+
+# Connection tuning for the long-lived shared connection. WAL with
+# synchronous=NORMAL stays durable across app crashes without an fsync per commit;
+# only an OS crash or power loss can roll back the last few commits.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",  # 64 MiB page cache ceiling, allocated as pages are used
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MB
+)
+SQLITE_CACHED_STATEMENTS = 256
+# Seconds a write waits on a lock held by another connection (sqlite busy_timeout)
+SQLITE_BUSY_TIMEOUT = 5.0
+
+# Items per check_duplicates query (3 bound params each, under SQLite's 999 limit)
+DUPLICATE_CHECK_CHUNK = 300
+
 # Title similarity scan limit
 TITLE_SCAN_LIMIT = 500
 
@@ -53,6 +77,7 @@ TRACKING_PARAMS = {
 }
 
 
+@lru_cache(maxsize=4096)
 def normalize_url(url: str) -> str:
     """
     Normalize URL by stripping tracking parameters and standardizing format.
@@ -61,6 +86,8 @@ def normalize_url(url: str) -> str:
     - Lowercases scheme and host
     - Removes trailing slashes
     - Handles reddit.com variants (old.reddit.com, www.reddit.com)
+
+    Memoized: the same URL is checked against articles and seen_urls, then stored.
     """
     try:
         parsed = urlparse(url)
@@ -73,12 +100,15 @@ def normalize_url(url: str) -> str:
         if host.startswith("www."):
             host = host[4:]
 
-        # Filter out tracking params
-        query_params = parse_qs(parsed.query, keep_blank_values=True)
-        filtered_params = {
-            k: v for k, v in query_params.items() if k.lower() not in TRACKING_PARAMS
-        }
-        new_query = urlencode(filtered_params, doseq=True) if filtered_params else ""
+        # Filter out tracking params (most feed URLs have no query at all)
+        new_query = ""
+        if parsed.query:
+            query_params = parse_qs(parsed.query, keep_blank_values=True)
+            filtered_params = {
+                k: v for k, v in query_params.items() if k.lower() not in TRACKING_PARAMS
+            }
+            if filtered_params:
+                new_query = urlencode(filtered_params, doseq=True)
 
         # Rebuild URL
         normalized = urlunparse(
@@ -97,14 +127,18 @@ def normalize_url(url: str) -> str:
         return url  # Return original if parsing fails
 
 
+def _utc_now_iso() -> str:
+    """Current UTC time in the ISO format stored in created_at/published_at."""
+    return datetime.now(timezone.utc).isoformat()
+
+
 def compute_content_hash(title: str, content: str) -> str:
     """
     Compute a hash of the content for duplicate detection.
     Uses first 500 chars of content + title to catch similar articles.
     """
-    # Normalize: lowercase, remove extra whitespace
-    normalized = f"{title.lower()} {content[:500].lower()}"
-    normalized = re.sub(r"\s+", " ", normalized).strip()
+    # Normalize: lowercase, collapse whitespace (split() is far cheaper than a regex)
+    normalized = " ".join((title + " " + content[:500]).lower().split())
     return hashlib.sha256(normalized.encode()).hexdigest()[:32]
 
 
@@ -113,13 +147,21 @@ def title_similarity(title1: str, title2: str) -> float:
     Calculate similarity ratio between two titles (0.0 to 1.0).
     Uses SequenceMatcher for fuzzy matching.
     """
-    return SequenceMatcher(None, title1.lower().strip(), title2.lower().strip()).ratio()
+    a, b = title1.lower().strip(), title2.lower().strip()
+    # Canonical order so (x, y) and (y, x) share a cache entry
+    return _title_ratio(a, b) if a <= b else _title_ratio(b, a)
+
 
+@lru_cache(maxsize=2048)
+def _title_ratio(a: str, b: str) -> float:
+    """SequenceMatcher ratio of two normalized titles, memoized."""
+    return SequenceMatcher(None, a, b).ratio()
 
-def _column_exists(conn: sqlite3.Connection, table: str, column: str) -> bool:
-    """Check if a column exists in a table using PRAGMA table_info."""
+
+def _table_columns(conn: sqlite3.Connection, table: str) -> set[str]:
+    """Column names of a table from a single PRAGMA table_info scan."""
     cursor = conn.execute(f"PRAGMA table_info({table})")  # noqa: S608
-    return any(row[1] == column for row in cursor.fetchall())
+    return {row[1] for row in cursor.fetchall()}
 
 
 def _get_schema_version(conn: sqlite3.Connection) -> int:
@@ -132,28 +174,30 @@ def _get_schema_version(conn: sqlite3.Connection) -> int:
         return -1
 
 
+# Column added by each migration, in order (index i = migration i -> i+1)
+_MIGRATION_COLUMNS = (
+    "content_hash",
+    "local_image_path",
+    "local_video_path",
+    "media_type",
+    "video_width",
+    "video_height",
+    "normalized_url",
+    "publish_fail_count",
+    "telegram_file_id",
+)
+
+
 def _bootstrap_version(conn: sqlite3.Connection) -> int:
     """Detect schema version for existing databases without schema_version table."""
     # Check which columns exist to determine version
-    if not _column_exists(conn, "articles", "id"):
+    columns = _table_columns(conn, "articles")
+    if "id" not in columns:
         return 0  # Fresh DB, no tables yet
-    if not _column_exists(conn, "articles", "content_hash"):
-        return 0
-    if not _column_exists(conn, "articles", "local_image_path"):
-        return 1
-    if not _column_exists(conn, "articles", "local_video_path"):
-        return 2
-    if not _column_exists(conn, "articles", "media_type"):
-        return 3
-    if not _column_exists(conn, "articles", "video_width"):
-        return 4
-    if not _column_exists(conn, "articles", "video_height"):
-        return 5
-    if not _column_exists(conn, "articles", "normalized_url"):
-        return 6
-    if not _column_exists(conn, "articles", "publish_fail_count"):
-        return 7
-    return 8  # All migrations applied
+    for version, column in enumerate(_MIGRATION_COLUMNS):
+        if column not in columns:
+            return version
+    return len(_MIGRATION_COLUMNS)  # All migrations applied
 
 
 # Numbered migrations. Each is a callable(conn) that applies one migration step.
@@ -179,25 +223,30 @@ _MIGRATIONS = [
     lambda conn: conn.execute(
         "ALTER TABLE articles ADD COLUMN publish_fail_count INTEGER NOT NULL DEFAULT 0"
     ),
+    # 8 -> 9: add telegram_file_id
+    lambda conn: conn.execute("ALTER TABLE articles ADD COLUMN telegram_file_id TEXT"),
 ]
 
 
 def _migration_add_normalized_url(conn: sqlite3.Connection) -> None:
     """Migration 6->7: add normalized_url column and backfill existing rows."""
     conn.execute("ALTER TABLE articles ADD COLUMN normalized_url TEXT")
-    rows = conn.execute("SELECT id, original_url FROM articles").fetchall()
-    for row in rows:
-        conn.execute(
-            "UPDATE articles SET normalized_url = ? WHERE id = ?",
-            (normalize_url(row["original_url"]), row["id"]),
-        )
+    # normalize_url is registered on the connection by init_database
+    conn.execute("UPDATE articles SET normalized_url = normalize_url(original_url)")
 
 
 def init_database(db_path: str) -> sqlite3.Connection:
     """Initialize database with versioned migrations."""
-    conn = sqlite3.connect(db_path, check_same_thread=False)
+    conn = sqlite3.connect(
+        db_path,
+        timeout=SQLITE_BUSY_TIMEOUT,
+        check_same_thread=False,
+        cached_statements=SQLITE_CACHED_STATEMENTS,
+    )
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
+    conn.create_function("normalize_url", 1, normalize_url, deterministic=True)
+    for pragma in SQLITE_PRAGMAS:
+        conn.execute(pragma)
 
     # Create core tables (includes all columns for fresh databases)
     conn.execute("""
@@ -219,7 +268,8 @@ def init_database(db_path: str) -> sqlite3.Connection:
             published_at TEXT,
             publish_fail_count INTEGER NOT NULL DEFAULT 0,
             video_width INTEGER,
-            video_height INTEGER
+            video_height INTEGER,
+            telegram_file_id TEXT
         )
     """)
 
@@ -233,6 +283,18 @@ def init_database(db_path: str) -> sqlite3.Connection:
         ON articles(content_hash)
     """)
 
+    # Latest publish time for get_last_publish_time: one index seek
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_articles_published
+        ON articles(status, published_at)
+    """)
+
+    # Recent live titles for find_similar_title: one created_at range, no sort
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_articles_recent
+        ON articles(created_at) WHERE status IN ('pending', 'approved', 'published')
+    """)
+
     conn.execute("""
         CREATE TABLE IF NOT EXISTS seen_urls (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -292,43 +354,50 @@ def init_database(db_path: str) -> sqlite3.Connection:
     return conn
 
 
-def article_exists(
-    conn: sqlite3.Connection, url: str, normalized: Optional[str] = None
-) -> bool:
-    """Check if article URL already exists (uses indexed normalized_url column)."""
-    if normalized is None:
-        normalized = normalize_url(url)
-    cursor = conn.execute(
-        "SELECT 1 FROM articles WHERE normalized_url = ?",
-        (normalized,),
-    )
-    return cursor.fetchone() is not None
-
-
-def url_seen(
-    conn: sqlite3.Connection, url: str, normalized: Optional[str] = None
-) -> bool:
-    """Check if URL has been seen before (in seen_urls table)."""
-    if normalized is None:
-        normalized = normalize_url(url)
-    cursor = conn.execute(
-        "SELECT 1 FROM seen_urls WHERE normalized_url = ?", (normalized,)
-    )
-    return cursor.fetchone() is not None
+@contextmanager
+def transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """
+    Group several helper calls (made with commit=False) into one transaction.
+    Commits on success and rolls back if the block raises.
+    """
+    with conn:
+        yield conn
 
 
-def content_hash_exists(conn: sqlite3.Connection, content_hash: str) -> bool:
-    """Check if content hash already exists (duplicate content detection)."""
-    cursor = conn.execute(
-        """
-        SELECT 1 FROM articles WHERE content_hash = ?
-        UNION ALL
-        SELECT 1 FROM seen_urls WHERE content_hash = ?
-        LIMIT 1
-        """,
-        (content_hash, content_hash),
-    )
-    return cursor.fetchone() is not None
+def check_duplicates(
+    conn: sqlite3.Connection, items: list[tuple[str, str]]
+) -> dict[int, str]:
+    """
+    Run URL and content hash dedup checks for many articles at once.
+    items are (normalized_url, content_hash) pairs. Returns {index: "url" | "hash"}
+    for every item that already exists; URL matches win over hash matches.
+    """
+    duplicates: dict[int, str] = {}
+    for start in range(0, len(items), DUPLICATE_CHECK_CHUNK):
+        chunk = items[start : start + DUPLICATE_CHECK_CHUNK]
+        values = ", ".join(["(?, ?, ?)"] * len(chunk))
+        params = [
+            value
+            for i, (normalized, content_hash) in enumerate(chunk, start)
+            for value in (i, normalized, content_hash)
+        ]
+        cursor = conn.execute(
+            f"""
+            WITH q(i, n, h) AS (VALUES {values})
+            SELECT i, 'url' FROM q
+            WHERE EXISTS (SELECT 1 FROM articles WHERE normalized_url = q.n)
+               OR EXISTS (SELECT 1 FROM seen_urls WHERE normalized_url = q.n)
+            UNION ALL
+            SELECT i, 'hash' FROM q
+            WHERE EXISTS (SELECT 1 FROM articles WHERE content_hash = q.h)
+               OR EXISTS (SELECT 1 FROM seen_urls WHERE content_hash = q.h)
+            """,  # noqa: S608
+            params,
+        )
+        for i, kind in cursor.fetchall():
+            if duplicates.get(i) != "url":
+                duplicates[i] = kind
+    return duplicates
 
 
 def find_similar_title(
@@ -345,10 +414,14 @@ def find_similar_title(
     # Calculate cutoff date
     cutoff = (datetime.now(timezone.utc) - timedelta(days=max_age_days)).isoformat()
 
-    # Only fetch id and title for comparison (more efficient)
+    # Only fetch id and title for comparison (more efficient). A bounded scan beats
+    # an FTS5 trigram index: an OR of a title's trigrams matches most rows, so
+    # ranking them costs more than this whole loop.
+    # INDEXED BY: without ANALYZE stats the planner picks the composite status index
+    # and sorts, about twice as slow as walking the partial index.
     cursor = conn.execute(
         """
-        SELECT id, original_title FROM articles
+        SELECT id, original_title FROM articles INDEXED BY idx_articles_recent
         WHERE status IN ('pending', 'approved', 'published')
         AND created_at >= ?
         ORDER BY created_at DESC
@@ -356,14 +429,35 @@ def find_similar_title(
         """,
         (cutoff, TITLE_SCAN_LIMIT),
     )
-    for row in cursor:
-        existing_title = row["original_title"]
-        if title_similarity(title, existing_title) >= threshold:
+    query = title.lower().strip()
+    query_len = len(query)
+    for article_id, existing_title in cursor:
+        existing_title = existing_title.lower().strip()
+        # Only exact upper bounds on ratio() may prune, so no true match is skipped.
+        # Length bound (same as real_quick_ratio): ratio() <= 2*min(len)/sum(len)
+        total_len = query_len + len(existing_title)
+        if total_len and 2 * min(query_len, len(existing_title)) < threshold * total_len:
+            continue
+        # quick_ratio is an upper bound on ratio()
+        matcher = SequenceMatcher(None, query, existing_title)
+        if matcher.quick_ratio() < threshold:
+            continue
+        if matcher.ratio() >= threshold:
             # Fetch full article only when match found
-            return get_article_by_id(conn, row["id"])
+            return get_article_by_id(conn, article_id)
     return None
 
 
+_UPSERT_SEEN_URL = """
+    INSERT INTO seen_urls (normalized_url, original_url, content_hash, status, reason, created_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(normalized_url) DO UPDATE SET
+        status = excluded.status,
+        reason = excluded.reason,
+        content_hash = excluded.content_hash
+"""
+
+
 def mark_url_seen(
     conn: sqlite3.Connection,
     url: str,
@@ -373,37 +467,48 @@ def mark_url_seen(
     normalized: Optional[str] = None,
     commit: bool = True,
 ) -> None:
-    """Mark a URL as seen with its status and reason."""
+    """Mark a URL as seen with its status and reason (updates an existing entry)."""
     if normalized is None:
         normalized = normalize_url(url)
-    try:
-        conn.execute(
-            """
-            INSERT INTO seen_urls (normalized_url, original_url, content_hash, status, reason, created_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
-            (
-                normalized,
-                url,
-                content_hash,
-                status,
-                reason,
-                datetime.now(timezone.utc).isoformat(),
-            ),
-        )
-    except sqlite3.IntegrityError:
-        # Already exists, update it
-        conn.execute(
-            """
-            UPDATE seen_urls SET status = ?, reason = ?, content_hash = ?
-            WHERE normalized_url = ?
-            """,
-            (status, reason, content_hash, normalized),
-        )
+    conn.execute(
+        _UPSERT_SEEN_URL,
+        (
+            normalized,
+            url,
+            content_hash,
+            status,
+            reason,
+            _utc_now_iso(),
+        ),
+    )
     if commit:
         conn.commit()
 
 
+def mark_urls_seen_bulk(
+    conn: sqlite3.Connection,
+    rows: list[tuple[str, str, Optional[str], str, Optional[str]]],
+) -> None:
+    """
+    Mark many URLs as seen in one transaction.
+    rows are (normalized_url, url, content_hash, status, reason) tuples.
+    """
+    if not rows:
+        return
+    now = _utc_now_iso()  # One timestamp for the whole batch
+    with conn:
+        conn.executemany(_UPSERT_SEEN_URL, [(*row, now) for row in rows])
+
+
+_INSERT_ARTICLE = """
+    INSERT INTO articles
+    (source_name, original_url, normalized_url, original_title, original_summary,
+     content_hash, image_url, local_image_path, local_video_path,
+     media_type, uzbek_content, video_width, video_height, status, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 def create_article(
     conn: sqlite3.Connection,
     source_name: str,
@@ -420,45 +525,56 @@ def create_article(
     video_height: Optional[int] = None,
     normalized: Optional[str] = None,
     commit: bool = True,
+    status: str = "pending",
 ) -> int:
-    """Create article with status 'pending'. Returns article ID."""
+    """Create article with the given status ('pending' by default). Returns article ID."""
     if normalized is None:
         normalized = normalize_url(original_url)
-    cursor = conn.execute(
-        """
-        INSERT INTO articles
-        (source_name, original_url, normalized_url, original_title, original_summary,
-         content_hash, image_url, local_image_path, local_video_path,
-         media_type, uzbek_content, status, created_at, video_width, video_height)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'pending', ?, ?, ?)
-        """,
-        (
-            source_name,
-            original_url,
-            normalized,
-            original_title,
-            original_summary,
-            content_hash,
-            image_url,
-            local_image_path,
-            local_video_path,
-            media_type,
-            uzbek_content,
-            datetime.now(timezone.utc).isoformat(),
-            video_width,
-            video_height,
-        ),
+    row = (
+        source_name,
+        original_url,
+        normalized,
+        original_title,
+        original_summary,
+        content_hash,
+        image_url,
+        local_image_path,
+        local_video_path,
+        media_type,
+        uzbek_content,
+        video_width,
+        video_height,
     )
-    if commit:
-        conn.commit()
-    return cursor.lastrowid
+    return create_articles_bulk(conn, [row], status=status, commit=commit)[0]
+
+
+def create_articles_bulk(
+    conn: sqlite3.Connection,
+    rows: list[tuple],
+    status: str = "pending",
+    commit: bool = True,
+) -> list[int]:
+    """
+    Insert many articles in one transaction. Returns their IDs in order.
+    Each row is (source_name, original_url, normalized_url, original_title,
+    original_summary, content_hash, image_url, local_image_path, local_video_path,
+    media_type, uzbek_content, video_width, video_height).
+    """
+    now = _utc_now_iso()
+    with transaction(conn) if commit else nullcontext():
+        return [
+            conn.execute(_INSERT_ARTICLE, (*row, status, now)).lastrowid for row in rows
+        ]
 
 
 def get_article_by_id(conn: sqlite3.Connection, article_id: int) -> Optional[Article]:
     """Get article by ID."""
-    cursor = conn.execute("SELECT * FROM articles WHERE id = ?", (article_id,))
+    cursor = conn.execute(
+        f"SELECT {_ARTICLE_COLUMNS} FROM articles WHERE id = ?",  # noqa: S608
+        (article_id,),
+    )
     row = cursor.fetchone()
-    return Article(**dict(row)) if row else None
+    return Article(*row) if row else None
 
 
 def update_article_status(
@@ -473,21 +589,46 @@ def update_article_status(
         conn.commit()
 
 
+def update_article_statuses(
+    conn: sqlite3.Connection, updates: list[tuple[int, str]]
+) -> None:
+    """Apply several (article_id, status) updates in one transaction."""
+    conn.executemany(
+        "UPDATE articles SET status = ? WHERE id = ?",
+        [(status, article_id) for article_id, status in updates],
+    )
+    conn.commit()
+
+
+def set_article_file_id(
+    conn: sqlite3.Connection, article_id: int, file_id: str, commit: bool = True
+) -> None:
+    """Store the Telegram file_id of the article's uploaded photo for reuse."""
+    conn.execute(
+        "UPDATE articles SET telegram_file_id = ? WHERE id = ?",
+        (file_id, article_id),
+    )
+    if commit:
+        conn.commit()
+
+
 def get_next_publishable(conn: sqlite3.Connection) -> Optional[Article]:
     """Get oldest approved article."""
     cursor = conn.execute(
-        """
-        SELECT * FROM articles
+        f"""
+        SELECT {_ARTICLE_COLUMNS} FROM articles
         WHERE status = 'approved'
         ORDER BY created_at ASC
         LIMIT 1
-        """
+        """  # noqa: S608
     )
     row = cursor.fetchone()
-    return Article(**dict(row)) if row else None
+    return Article(*row) if row else None
 
 
-def mark_published(conn: sqlite3.Connection, article_id: int) -> None:
+def mark_published(
+    conn: sqlite3.Connection, article_id: int, commit: bool = True
+) -> None:
     """Mark article as published with timestamp."""
     conn.execute(
         """
@@ -495,15 +636,21 @@ def mark_published(conn: sqlite3.Connection, article_id: int) -> None:
         SET status = 'published', published_at = ?
         WHERE id = ?
         """,
-        (datetime.now(timezone.utc).isoformat(), article_id),
+        (_utc_now_iso(), article_id),
     )
-    conn.commit()
+    if commit:
+        conn.commit()
 
 
 def get_last_publish_time(conn: sqlite3.Connection) -> Optional[datetime]:
     """Get timestamp of most recently published article."""
     cursor = conn.execute(
-        "SELECT MAX(published_at) FROM articles WHERE status = 'published'"
+        """
+        SELECT published_at FROM articles
+        WHERE status = 'published'
+        ORDER BY published_at DESC
+        LIMIT 1
+        """
     )
     row = cursor.fetchone()
     if row and row[0]:
@@ -517,18 +664,33 @@ def get_pending_count(conn: sqlite3.Connection) -> int:
     return cursor.fetchone()[0]
 
 
-def get_pending_articles(conn: sqlite3.Connection) -> list[Article]:
-    """Get all pending articles ordered by creation date."""
+def iter_pending_articles(conn: sqlite3.Connection) -> Iterator[Article]:
+    """Yield pending articles ordered by creation date, one row at a time."""
     cursor = conn.execute(
-        "SELECT * FROM articles WHERE status = 'pending' ORDER BY created_at ASC"
+        f"SELECT {_ARTICLE_COLUMNS} FROM articles "  # noqa: S608
+        "WHERE status = 'pending' ORDER BY created_at ASC"
     )
-    return [Article(**dict(row)) for row in cursor.fetchall()]
+    for row in cursor:
+        yield Article(*row)
 
 
-def get_approved_count(conn: sqlite3.Connection) -> int:
-    """Count approved articles waiting to publish."""
-    cursor = conn.execute("SELECT COUNT(*) FROM articles WHERE status = 'approved'")
-    return cursor.fetchone()[0]
+def get_pending_articles(
+    conn: sqlite3.Connection, limit: Optional[int] = None
+) -> list[Article]:
+    """Get pending articles ordered by creation date (the first `limit` if given)."""
+    return list(islice(iter_pending_articles(conn), limit))
+
+
+def get_status_counts(conn: sqlite3.Connection) -> dict[str, int]:
+    """Count pending and approved articles with a single grouped query."""
+    cursor = conn.execute(
+        """
+        SELECT status, COUNT(*) FROM articles
+        WHERE status IN ('pending', 'approved')
+        GROUP BY status
+        """
+    )
+    return {row[0]: row[1] for row in cursor}
 
 
 def get_queue_count(conn: sqlite3.Connection) -> int:
@@ -551,17 +713,18 @@ def reject_all_pending(conn: sqlite3.Connection) -> int:
 MAX_PUBLISH_RETRIES = 3
 
 
-def increment_publish_failures(conn: sqlite3.Connection, article_id: int) -> int:
+def increment_publish_failures(
+    conn: sqlite3.Connection, article_id: int, commit: bool = True
+) -> int:
     """Increment publish failure count and return the new value."""
-    conn.execute(
-        "UPDATE articles SET publish_fail_count = COALESCE(publish_fail_count, 0) + 1 WHERE id = ?",
-        (article_id,),
-    )
-    conn.commit()
     cursor = conn.execute(
-        "SELECT publish_fail_count FROM articles WHERE id = ?", (article_id,)
+        "UPDATE articles SET publish_fail_count = COALESCE(publish_fail_count, 0) + 1 "
+        "WHERE id = ? RETURNING publish_fail_count",
+        (article_id,),
     )
     row = cursor.fetchone()
+    if commit:
+        conn.commit()
     return row[0] if row else 0
 
 
@@ -5,10 +5,11 @@ import html
 import logging
 import re
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Optional
 
 import feedparser
 import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +17,44 @@ logger = logging.getLogger(__name__)
 MIN_IMAGE_WIDTH = 200
 MIN_IMAGE_HEIGHT = 200
 
+# Shared HTTP client pool (feeds and media downloads)
+HTTP_MAX_CONNECTIONS = 50
+HTTP_KEEPALIVE_CONNECTIONS = 20
+HTTP_KEEPALIVE_EXPIRY = 30.0  # seconds
+
+# Sources fetched at once; keeps the pool above from queueing feed requests
+FETCH_MAX_CONCURRENT = 10
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_IMG_SRC_RE = re.compile(r'<img[^>]+src=["\']([^"\']+)["\'][^>]*>', re.IGNORECASE)
+
+# Substrings of image URLs that are icons, share buttons, trackers, etc.
+JUNK_IMAGE_PATTERNS = (
+    "icon",
+    "logo",
+    "badge",
+    "avatar",
+    "emoji",
+    "button",
+    "pixel",
+    "tracking",
+    "ads",
+    "banner",
+    "sprite",
+    "1x1",
+    "spacer",
+    "share",
+    "social",
+    "facebook",
+    "twitter",
+    "linkedin",
+    "pinterest",
+    "feed-",
+    "placeholder",
+    "default",
+    "blank",
+)
+
 
 def strip_html(text: str) -> str:
     """
@@ -25,12 +64,11 @@ def strip_html(text: str) -> str:
     if not text:
         return ""
     # Remove HTML tags
-    clean = re.sub(r"<[^>]+>", " ", text)
+    clean = _TAG_RE.sub(" ", text)
     # Decode HTML entities (&amp; -> &, &lt; -> <, etc.)
     clean = html.unescape(clean)
-    # Normalize whitespace
-    clean = re.sub(r"\s+", " ", clean).strip()
-    return clean
+    # Normalize whitespace (split() matches \s and runs in one C pass)
+    return " ".join(clean.split())
 
 
 def extract_image_from_html(html_content: str) -> Optional[str]:
@@ -42,15 +80,8 @@ def extract_image_from_html(html_content: str) -> Optional[str]:
         return None
 
     # Find all img tags with src attribute
-    img_pattern = r'<img[^>]+src=["\']([^"\']+)["\'][^>]*>'
-    matches = re.findall(img_pattern, html_content, re.IGNORECASE)
-
-    for url in matches:
-        # Skip junk images (icons, share buttons, etc.)
-        if is_junk_image_url(url):
-            continue
-
-        # Skip data URLs
+    for url in _IMG_SRC_RE.findall(html_content):
+        # Skip data URLs (checked before the junk scan: they can be KBs of base64)
         if url.startswith("data:"):
             continue
 
@@ -58,6 +89,10 @@ def extract_image_from_html(html_content: str) -> Optional[str]:
         if len(url) < 20:
             continue
 
+        # Skip junk images (icons, share buttons, etc.)
+        if is_junk_image_url(url):
+            continue
+
         return url
 
     return None
@@ -71,41 +106,15 @@ def is_junk_image_url(url: str) -> bool:
     lower = url.lower()
 
     # Skip common junk patterns
-    junk_patterns = [
-        "icon",
-        "logo",
-        "badge",
-        "avatar",
-        "emoji",
-        "button",
-        "pixel",
-        "tracking",
-        "ads",
-        "banner",
-        "sprite",
-        "1x1",
-        "spacer",
-        "share",
-        "social",
-        "facebook",
-        "twitter",
-        "linkedin",
-        "pinterest",
-        "feed-",
-        "placeholder",
-        "default",
-        "blank",
-    ]
-
-    return any(pattern in lower for pattern in junk_patterns)
-
-
-def extract_image_from_media_thumbnail(entry) -> Optional[str]:
+    return any(pattern in lower for pattern in JUNK_IMAGE_PATTERNS)
+
+
+def extract_image_from_media_thumbnail(entry: Any) -> Optional[str]:
     """Extract image from media:thumbnail RSS element."""
     # Try media_thumbnail (list of thumbnails)
-    if hasattr(entry, "media_thumbnail") and entry.media_thumbnail:
+    thumbnails = entry.get("media_thumbnail")
+    if thumbnails:
         # Get the largest thumbnail
-        thumbnails = entry.media_thumbnail
         if isinstance(thumbnails, list) and len(thumbnails) > 0:
             # Sort by width if available, take largest
             best = max(
@@ -119,22 +128,23 @@ def extract_image_from_media_thumbnail(entry) -> Optional[str]:
     return None
 
 
-def extract_image_from_entry(entry, content: str) -> Optional[str]:
+def extract_image_from_entry(entry: Any, content: str) -> Optional[str]:
     """
     Extract image URL from RSS entry using multiple methods.
     Priority:
     1. media:content
     2. media:thumbnail
     3. enclosures
-    4. <img> tags in content
+    4. <img> tags in content (the raw HTML body the caller already extracted)
 
     Filters out junk images (icons, share buttons, etc.) at each step.
     """
     image_url = None
 
     # 1. media:content (most reliable for media RSS)
-    if hasattr(entry, "media_content") and entry.media_content:
-        for media in entry.media_content:
+    media_content = entry.get("media_content")
+    if media_content:
+        for media in media_content:
             media_type = media.get("type", "")
             if media_type.startswith("image/") or not media_type:
                 url = media.get("url")
@@ -149,8 +159,9 @@ def extract_image_from_entry(entry, content: str) -> Optional[str]:
             image_url = url
 
     # 3. enclosures
-    if not image_url and hasattr(entry, "enclosures") and entry.enclosures:
-        for enc in entry.enclosures:
+    enclosures = None if image_url else entry.get("enclosures")
+    if enclosures:
+        for enc in enclosures:
             enc_type = enc.get("type", "")
             if enc_type.startswith("image/"):
                 url = enc.get("href") or enc.get("url")
@@ -158,24 +169,15 @@ def extract_image_from_entry(entry, content: str) -> Optional[str]:
                     image_url = url
                     break
 
-    # 4. Extract from content HTML (last resort, already filters junk)
-    if not image_url:
-        # Try content:encoded first (usually has full HTML)
-        html_content = ""
-        if hasattr(entry, "content") and entry.content:
-            html_content = entry.content[0].value
-        elif hasattr(entry, "summary"):
-            html_content = entry.summary
-        elif hasattr(entry, "description"):
-            html_content = entry.description
-
-        if html_content:
-            image_url = extract_image_from_html(html_content)
+    # 4. Extract from content HTML (last resort, already filters junk).
+    # The caller already picked content:encoded/summary/description, so reuse it.
+    if not image_url and content:
+        image_url = extract_image_from_html(content)
 
     return image_url
 
 
-@dataclass
+@dataclass(slots=True)
 class FetchedArticle:
     """Article fetched from a source before processing."""
 
@@ -191,12 +193,31 @@ class FetchedArticle:
     source_type: str = "rss"
 
 
+_fetch_semaphore = asyncio.Semaphore(FETCH_MAX_CONCURRENT)
+
+# Feed URL -> (ETag, Last-Modified, articles) from the last full response
+_feed_cache: dict[str, tuple[Optional[str], Optional[str], list[FetchedArticle]]] = {}
+
+
 def create_http_client() -> httpx.AsyncClient:
-    """Create HTTP client with retries and timeout."""
-    transport = httpx.AsyncHTTPTransport(retries=3)
+    """
+    Create HTTP client with retries and timeout.
+    HTTP/2 with a keepalive pool lets feed and media requests to one host share a
+    TLS connection.
+    """
+    # http2/limits must go on the transport: the client ignores them when given one
+    transport = httpx.AsyncHTTPTransport(
+        retries=3,
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        ),
+    )
     return httpx.AsyncClient(
         transport=transport,
-        timeout=httpx.Timeout(30.0),
+        timeout=httpx.Timeout(30.0, connect=10.0),
         follow_redirects=True,
         headers={
             "User-Agent": "Olamda-Nima-Gap/1.0",
@@ -205,29 +226,23 @@ def create_http_client() -> httpx.AsyncClient:
     )
 
 
-async def fetch_rss(http_client: httpx.AsyncClient, url: str) -> list[FetchedArticle]:
-    """Fetch articles from RSS feed."""
+def _parse_rss(url: str, body: bytes) -> list[FetchedArticle]:
+    """Parse feed text into articles (CPU-bound: runs in a worker thread)."""
     articles = []
 
     try:
-        response = await http_client.get(url)
-        response.raise_for_status()
-
-        loop = asyncio.get_running_loop()
-        feed = await asyncio.wait_for(
-            loop.run_in_executor(None, feedparser.parse, response.text),
-            timeout=30,
-        )
+        # Raw bytes: feedparser sniffs the XML encoding declaration itself and
+        # we skip materializing a decoded copy of the whole feed
+        feed = feedparser.parse(body)
 
         for entry in feed.entries[:20]:  # Limit to recent 20
-            # Extract content
-            content = ""
-            if hasattr(entry, "content") and entry.content:
-                content = entry.content[0].value
-            elif hasattr(entry, "summary"):
-                content = entry.summary
-            elif hasattr(entry, "description"):
-                content = entry.description
+            # Extract content (mapping access: hasattr raises and catches
+            # AttributeError inside FeedParserDict for every missing key)
+            entry_content = entry.get("content")
+            if entry_content:
+                content = entry_content[0].value
+            else:
+                content = entry.get("summary") or entry.get("description") or ""
 
             # Extract image using enhanced extraction
             image_url = extract_image_from_entry(entry, content)
@@ -243,12 +258,54 @@ async def fetch_rss(http_client: httpx.AsyncClient, url: str) -> list[FetchedArt
             )
 
     except Exception as e:
-        logger.error(f"Failed to fetch RSS {url}: {e}")
+        logger.error(f"Failed to parse RSS {url}: {e}")
 
     return articles
 
 
-def extract_reddit_image(post_data: dict) -> Optional[str]:
+async def fetch_rss(http_client: httpx.AsyncClient, url: str) -> list[FetchedArticle]:
+    """
+    Fetch articles from RSS feed.
+    Sends the last ETag/Last-Modified; on 304 the previously parsed articles are
+    returned, so entries left unprocessed last cycle are still offered.
+    """
+    try:
+        headers = {}
+        cached = _feed_cache.get(url)
+        if cached:
+            etag, last_modified, cached_articles = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        response = await http_client.get(url, headers=headers)
+        if response.status_code == 304 and cached:
+            return list(cached_articles)
+        response.raise_for_status()
+
+        # Parsing, HTML stripping and image extraction all stay off the event loop
+        loop = asyncio.get_running_loop()
+        articles = await asyncio.wait_for(
+            loop.run_in_executor(None, _parse_rss, url, response.content),
+            timeout=30,
+        )
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            _feed_cache[url] = (etag, last_modified, articles)
+        else:
+            _feed_cache.pop(url, None)
+        return list(articles)
+
+    except Exception as e:
+        logger.error(f"Failed to fetch RSS {url}: {e}")
+
+    return []
+
+
+def extract_reddit_image(post_data: dict[str, Any]) -> Optional[str]:
     """
     Extract the best image from a Reddit post.
     Tries preview images first, then thumbnail.
@@ -302,7 +359,7 @@ def is_youtube_url(url: str) -> bool:
     )
 
 
-def extract_gallery_image(post_data: dict) -> Optional[str]:
+def extract_gallery_image(post_data: dict[str, Any]) -> Optional[str]:
     """
     Extract the first full-size image from a Reddit gallery post.
     Gallery posts have is_gallery=True and images in media_metadata.
@@ -338,7 +395,7 @@ def extract_gallery_image(post_data: dict) -> Optional[str]:
     return None
 
 
-def extract_reddit_media(post_data: dict) -> tuple[Optional[str], str]:
+def extract_reddit_media(post_data: dict[str, Any]) -> tuple[Optional[str], str]:
     """
     Extract the best media URL and type from a Reddit post.
     Returns (url, media_type) where media_type is "image" or "video".
@@ -423,7 +480,9 @@ async def fetch_reddit(
         response = await http_client.get(url)
         response.raise_for_status()
 
-        data = response.json()
+        # orjson decodes the raw bytes ~3x faster than response.json(); at well
+        # under a millisecond per page it no longer needs a worker thread
+        data = orjson.loads(response.content)
 
         for post in data.get("data", {}).get("children", []):
             post_data = post.get("data", {})
@@ -447,15 +506,15 @@ async def fetch_reddit(
             media_url, media_type = extract_reddit_media(post_data)
 
             # Build content from title + selftext if available
-            content = post_data.get("title", "")
-            if selftext and selftext not in ("[removed]", "[deleted]"):
-                content = f"{content}\n\n{selftext}"
+            # (removed/deleted selftext was already skipped above)
+            title = post_data.get("title", "")
+            content = f"{title}\n\n{selftext}" if selftext else title
 
             permalink = post_data.get("permalink", "")
             articles.append(
                 FetchedArticle(
                     url=f"https://reddit.com{permalink}",
-                    title=post_data.get("title", ""),
+                    title=title,
                     content=content,
                     image_url=media_url,
                     media_type=media_type,
@@ -486,13 +545,15 @@ async def fetch_source(
 
     source_type = source.get("type", "rss")
 
-    if source_type == "reddit":
-        subreddit = source.get("subreddit")
-        if subreddit:
-            return await fetch_reddit(http_client, subreddit)
-    else:  # rss
-        url = source.get("url")
-        if url:
-            return await fetch_rss(http_client, url)
+    # Taken after the stagger delay so sleeping sources don't hold a slot
+    async with _fetch_semaphore:
+        if source_type == "reddit":
+            subreddit = source.get("subreddit")
+            if subreddit:
+                return await fetch_reddit(http_client, subreddit)
+        else:  # rss
+            url = source.get("url")
+            if url:
+                return await fetch_rss(http_client, url)
 
     return []
@@ -5,15 +5,24 @@ import functools
 import logging
 import os
 import signal
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from itertools import zip_longest
+from typing import Optional
 
 from .ai import (
-    classify_article,
+    CLASSIFY_BATCH_SIZE,
+    ClassificationResult,
+    classify_and_translate,
+    classify_articles_batch,
     get_token_stats,
     init_gemini,
     is_circuit_open,
+    load_response_cache,
+    refresh_prompt_cache,
     reset_circuit_breaker,
     reset_token_stats,
+    save_response_cache,
     translate_article,
 )
 from .bot import (
@@ -25,10 +34,9 @@ from .bot import (
 from .config import load_config
 from .database import (
     MAX_PUBLISH_RETRIES,
-    article_exists,
+    check_duplicates,
     cleanup_old_seen_urls,
     compute_content_hash,
-    content_hash_exists,
     create_article,
     find_similar_title,
     get_last_publish_time,
@@ -38,10 +46,12 @@ from .database import (
     init_database,
     mark_published,
     mark_url_seen,
+    mark_urls_seen_bulk,
     normalize_url,
     reject_all_pending,
+    title_similarity,
+    transaction,
     update_article_status,
-    url_seen,
 )
 from .fetcher import FetchedArticle, create_http_client, fetch_source
 from .health import start_health_server
@@ -58,140 +68,148 @@ REMAINING_CHECK_INTERVAL = 300  # 5 minutes
 REFETCH_INTERVAL = 10800  # 3 hours
 CLEANUP_INTERVAL = 86400  # 24 hours
 
+# Same threshold find_similar_title uses for DB lookups
+TITLE_SIMILARITY_THRESHOLD = 0.85
+
+# Articles looked up per check_duplicates round trip during pre-checks
+PRECHECK_WINDOW = 50
+
+# Classified articles downloaded/translated at once (Gemini pacing lives in ai.py)
+PROCESS_CONCURRENCY = 3
+
+# Gemini response cache file (inside data_dir)
+LLM_CACHE_FILE = "llm_cache.json"
+
 
 def _interleave_sources(
     articles_by_source: list[list[tuple[str, FetchedArticle]]],
 ) -> list[tuple[str, FetchedArticle]]:
     """Round-robin interleave articles from different sources."""
-    all_articles: list[tuple[str, FetchedArticle]] = []
-    while articles_by_source:
-        empty_sources = []
-        for i, source_list in enumerate(articles_by_source):
-            if source_list:
-                all_articles.append(source_list.pop(0))
-            if not source_list:
-                empty_sources.append(i)
-        for i in reversed(empty_sources):
-            articles_by_source.pop(i)
-    return all_articles
+    # Single pass; shorter sources pad with None (articles are never None)
+    return [
+        item
+        for group in zip_longest(*articles_by_source)
+        for item in group
+        if item is not None
+    ]
+
+
+def _precheck_window(
+    db_conn, all_articles: list[tuple[str, FetchedArticle]], start: int
+) -> tuple[list[tuple[str, str]], dict[int, str]]:
+    """Normalize and hash the next PRECHECK_WINDOW articles and look them up at once.
+
+    Returns the (normalized_url, content_hash) keys and the check_duplicates hits,
+    both indexed relative to start.
+    """
+    keys = [
+        (normalize_url(article.url), compute_content_hash(article.title, article.content))
+        for _, article in all_articles[start : start + PRECHECK_WINDOW]
+    ]
+    return keys, check_duplicates(db_conn, keys)
 
 
-async def _process_article(
-    config,
+def _precheck_article(
     db_conn,
-    db_lock,
-    http_client,
-    gemini_client,
-    source_name: str,
     article: FetchedArticle,
-) -> str:
-    """Process a single article through the pipeline.
-
-    Returns one of: "new", "duplicate", "irrelevant", "failed".
+    normalized: str,
+    content_hash: str,
+    duplicate: Optional[str],
+    seen: list[tuple[str, str, Optional[str], str, Optional[str]]],
+) -> Optional[str]:
+    """Run dedup checks and cheap pre-filters before classification.
+
+    duplicate is the URL/content hash verdict from check_duplicates. Skipped
+    articles are appended to seen for a single mark_urls_seen_bulk write. Returns
+    "duplicate" or "irrelevant" when the article should not be classified,
+    None otherwise.
     """
     logger = logging.getLogger(__name__)
 
-    # Normalize URL once upfront
-    normalized = normalize_url(article.url)
-
-    # Check URL deduplication (normalized)
-    if article_exists(db_conn, article.url, normalized=normalized) or url_seen(
-        db_conn, article.url, normalized=normalized
-    ):
+    if duplicate == "url":
         return "duplicate"
 
-    # Compute content hash for duplicate detection
-    content_hash = compute_content_hash(article.title, article.content)
-
-    # Check content hash for similar content from different sources
-    if content_hash_exists(db_conn, content_hash):
+    # Similar content from different sources
+    if duplicate == "hash":
         logger.debug(f"Duplicate content hash: {article.title[:50]}")
-        async with db_lock:
-            mark_url_seen(
-                db_conn,
-                article.url,
-                content_hash,
-                "duplicate",
-                "content hash match",
-                normalized=normalized,
-            )
+        seen.append(
+            (normalized, article.url, content_hash, "duplicate", "content hash match")
+        )
         return "duplicate"
 
-    # Check for similar titles (inline — shares SQLite conn with event loop)
+    # Check for similar titles
     similar = find_similar_title(db_conn, article.title)
     if similar:
         logger.debug(
             f"Similar title found: {article.title[:50]} ~ {similar.original_title[:50]}"
         )
-        async with db_lock:
-            mark_url_seen(
-                db_conn,
+        seen.append(
+            (
+                normalized,
                 article.url,
                 content_hash,
                 "duplicate",
                 f"similar to article {similar.id}",
-                normalized=normalized,
             )
+        )
         return "duplicate"
 
     # Pre-filter: skip posts without media (save API calls)
     if not article.image_url:
         logger.debug(f"Skipped (no media): {article.title[:50]}")
-        async with db_lock:
-            mark_url_seen(
-                db_conn,
-                article.url,
-                content_hash,
-                "irrelevant",
-                "no media",
-                normalized=normalized,
-            )
+        seen.append((normalized, article.url, content_hash, "irrelevant", "no media"))
         return "irrelevant"
 
     # Pre-filter: skip low-karma Reddit posts
     if article.source_type == "reddit" and article.score < 1000:
         logger.debug(f"Skipped (low karma {article.score}): {article.title[:50]}")
-        async with db_lock:
-            mark_url_seen(
-                db_conn,
-                article.url,
-                content_hash,
-                "irrelevant",
-                "low karma",
-                normalized=normalized,
-            )
+        seen.append((normalized, article.url, content_hash, "irrelevant", "low karma"))
         return "irrelevant"
 
-    # Classify content
-    classification = await classify_article(
-        gemini_client,
-        config.gemini_model,
-        article.title,
-        article.content,
-        media_url=article.image_url,
-        source_type=article.source_type,
-    )
+    return None
 
-    if not classification.is_relevant:
-        logger.debug(f"Skipped: {article.title[:50]} - {classification.reason}")
-        async with db_lock:
-            mark_url_seen(
-                db_conn,
-                article.url,
-                content_hash,
-                "irrelevant",
-                classification.reason,
-                normalized=normalized,
-            )
-        return "irrelevant"
 
-    # Download and cache media (before translation for multimodal)
-    local_image_path = None
-    local_video_path = None
-    video_width = None
-    video_height = None
-    gemini_media_path = None
-    compressed_tmp_path = None
+def _find_batch_duplicate(
+    batch: list[tuple[str, FetchedArticle, str, str]],
+    article: FetchedArticle,
+    normalized: str,
+    content_hash: str,
+) -> Optional[FetchedArticle]:
+    """Find an article in the current batch that duplicates this one.
+
+    Batched articles are not in the DB yet, so the DB dedup checks miss them.
+    """
+    for _, other, other_normalized, other_hash in batch:
+        if (
+            other_normalized == normalized
+            or other_hash == content_hash
+            or title_similarity(other.title, article.title) >= TITLE_SIMILARITY_THRESHOLD
+        ):
+            return other
+    return None
+
+
+@dataclass
+class _DownloadedMedia:
+    """Local media for an article, ready for Gemini and Telegram."""
+
+    local_image_path: Optional[str] = None
+    local_video_path: Optional[str] = None
+    video_width: Optional[int] = None
+    video_height: Optional[int] = None
+    gemini_media_path: Optional[str] = None
+    # Compressed copy made for Gemini only; delete after the Gemini call
+    compressed_tmp_path: Optional[str] = None
+    # Set when a video post could not be downloaded (article must be skipped)
+    error: Optional[str] = None
+
+
+async def _download_media(
+    config, http_client, article: FetchedArticle
+) -> _DownloadedMedia:
+    """Download and cache article media (before translation for multimodal)."""
+    logger = logging.getLogger(__name__)
+    media = _DownloadedMedia()
 
     if article.media_type == "video" and article.image_url:
         video_url = (
@@ -205,81 +223,166 @@ async def _process_article(
                 else 0
             )
             if video_file_size > 0:
-                local_video_path = video_result.local_path
-                video_width = video_result.width
-                video_height = video_result.height
+                media.local_video_path = video_result.local_path
+                media.video_width = video_result.width
+                media.video_height = video_result.height
                 logger.info(
-                    f"Video verified: {video_url} -> {local_video_path} ({video_file_size} bytes)"
+                    f"Video verified: {video_url} -> {media.local_video_path} ({video_file_size} bytes)"
                 )
                 compressed = await compress_video_for_gemini(
-                    local_video_path, data_dir=config.data_dir
+                    media.local_video_path, data_dir=config.data_dir
                 )
                 if compressed:
-                    gemini_media_path = compressed
-                    if compressed != local_video_path:
-                        compressed_tmp_path = compressed
+                    media.gemini_media_path = compressed
+                    if compressed != media.local_video_path:
+                        media.compressed_tmp_path = compressed
             else:
                 logger.warning(
                     f"Video file empty or missing after download: {video_result.local_path}"
                 )
-                async with db_lock:
-                    mark_url_seen(
-                        db_conn,
-                        article.url,
-                        content_hash,
-                        "failed",
-                        "video file empty after download",
-                        normalized=normalized,
-                    )
-                return "failed"
+                media.error = "video file empty after download"
         else:
             logger.warning(
                 f"Video download failed for video post, skipping: {video_result.error}"
             )
-            async with db_lock:
-                mark_url_seen(
-                    db_conn,
-                    article.url,
-                    content_hash,
-                    "failed",
-                    f"video download failed: {video_result.error}",
-                    normalized=normalized,
-                )
-            return "failed"
+            media.error = f"video download failed: {video_result.error}"
     elif article.image_url:
         image_result = await download_image(
             http_client, article.image_url, data_dir=config.data_dir
         )
         if image_result.success:
-            local_image_path = image_result.local_path
-            gemini_media_path = image_result.local_path
-            logger.debug(f"Cached image: {article.image_url} -> {local_image_path}")
+            media.local_image_path = image_result.local_path
+            media.gemini_media_path = image_result.local_path
+            logger.debug(
+                f"Cached image: {article.image_url} -> {media.local_image_path}"
+            )
         else:
             logger.warning(f"Image download failed: {image_result.error}")
 
+    return media
+
+
+def _start_image_prefetch(
+    config, http_client, article: FetchedArticle
+) -> Optional["asyncio.Task[_DownloadedMedia]"]:
+    """Start an image download to overlap with classification (videos wait for the verdict)."""
+    if article.media_type == "video" or not article.image_url:
+        return None
+    return asyncio.create_task(_download_media(config, http_client, article))
+
+
+def _cancel_prefetches(classified: list[tuple]) -> None:
+    """Stop image downloads for classified articles left to the next cycle."""
+    for *_, media_task in classified:
+        if media_task:
+            media_task.cancel()
+
+
+async def _process_article(
+    config,
+    db_conn,
+    db_lock,
+    http_client,
+    gemini_client,
+    source_name: str,
+    article: FetchedArticle,
+    normalized: str,
+    content_hash: str,
+    classification: Optional[ClassificationResult],
+    media_task: Optional["asyncio.Task[_DownloadedMedia]"] = None,
+) -> str:
+    """Process a pre-checked article through the rest of the pipeline.
+
+    classification is None in fused mode: the article is then classified and
+    translated by a single Gemini call after its media is downloaded.
+    media_task is an image download already started during classification.
+    Returns one of: "new", "irrelevant", "failed".
+    """
+    logger = logging.getLogger(__name__)
+
+    if classification is not None and not classification.is_relevant:
+        logger.debug(f"Skipped: {article.title[:50]} - {classification.reason}")
+        async with db_lock:
+            await asyncio.to_thread(
+                mark_url_seen,
+                db_conn,
+                article.url,
+                content_hash,
+                "irrelevant",
+                classification.reason,
+                normalized=normalized,
+            )
+        return "irrelevant"
+
+    if media_task:
+        media = await media_task
+    else:
+        media = await _download_media(config, http_client, article)
+    if media.error:
+        async with db_lock:
+            await asyncio.to_thread(
+                mark_url_seen,
+                db_conn,
+                article.url,
+                content_hash,
+                "failed",
+                media.error,
+                normalized=normalized,
+            )
+        return "failed"
+
     # Translate (with source name, media type, and media for multimodal)
     try:
-        translation = await translate_article(
-            gemini_client,
-            config.gemini_model,
-            article.title,
-            article.content,
-            article.url,
-            source_name=source_name,
-            media_type=article.media_type,
-            media_path=gemini_media_path,
-        )
+        if classification is None:
+            classification, translation = await classify_and_translate(
+                gemini_client,
+                config.gemini_model,
+                article.title,
+                article.content,
+                article.url,
+                source_name=source_name,
+                media_type=article.media_type,
+                media_path=media.gemini_media_path,
+                media_url=article.image_url,
+                source_type=article.source_type,
+            )
+        else:
+            translation = await translate_article(
+                gemini_client,
+                config.gemini_model,
+                article.title,
+                article.content,
+                article.url,
+                source_name=source_name,
+                media_type=article.media_type,
+                media_path=media.gemini_media_path,
+            )
     finally:
-        if compressed_tmp_path:
+        if media.compressed_tmp_path:
             try:
-                os.remove(compressed_tmp_path)
+                os.remove(media.compressed_tmp_path)
             except OSError:
                 pass
 
+    if not classification.is_relevant:
+        logger.debug(f"Skipped: {article.title[:50]} - {classification.reason}")
+        async with db_lock:
+            await asyncio.to_thread(
+                mark_url_seen,
+                db_conn,
+                article.url,
+                content_hash,
+                "irrelevant",
+                classification.reason,
+                normalized=normalized,
+            )
+        return "irrelevant"
+
     if not translation.success:
         logger.warning(f"Translation failed for {article.url}: {translation.error}")
         async with db_lock:
-            mark_url_seen(
+            await asyncio.to_thread(
+                mark_url_seen,
                 db_conn,
                 article.url,
                 content_hash,
@@ -289,9 +392,10 @@ async def _process_article(
             )
         return "failed"
 
-    # Save to database (batch commit: create + approve together)
+    # Save to database, approved on insert
     async with db_lock:
-        article_id = create_article(
+        await asyncio.to_thread(
+            create_article,
             db_conn,
             source_name=source_name,
             original_url=article.url,
@@ -299,17 +403,15 @@ async def _process_article(
             original_summary=article.content[:2000],
             content_hash=content_hash,
             image_url=article.image_url,
-            local_image_path=local_image_path,
-            local_video_path=local_video_path,
+            local_image_path=media.local_image_path,
+            local_video_path=media.local_video_path,
             media_type=article.media_type,
             uzbek_content=translation.content,
-            video_width=video_width,
-            video_height=video_height,
+            video_width=media.video_width,
+            video_height=media.video_height,
             normalized=normalized,
-            commit=False,
+            status="approved",
         )
-        update_article_status(db_conn, article_id, "approved", commit=False)
-        db_conn.commit()
 
     logger.info(f"New article: {article.title[:50]}")
     return "new"
@@ -333,6 +435,7 @@ async def fetch_job(
     # Reset stats and circuit breaker for this cycle
     reset_token_stats()
     reset_circuit_breaker()
+    await refresh_prompt_cache(gemini_client, config.gemini_model)
 
     errors = []
     new_articles = 0
@@ -373,12 +476,26 @@ async def fetch_job(
     all_articles = _interleave_sources(articles_by_source)
     logger.info(f"Total fetched: {len(all_articles)} articles (interleaved)")
 
-    # Process articles with limit
+    # Process articles with limit, classifying pre-checked candidates in batches
     processed = 0
     max_to_process = config.max_new_articles_per_fetch
-
-    for source_name, article in all_articles:
+    index = 0
+    classified: list[
+        tuple[
+            str,
+            FetchedArticle,
+            str,
+            str,
+            Optional[ClassificationResult],
+            Optional["asyncio.Task[_DownloadedMedia]"],
+        ]
+    ] = []
+
+    while classified or index < len(all_articles):
         if new_articles >= max_to_process:
+            # Classified leftovers are picked up next cycle (verdicts are cached)
+            _cancel_prefetches(classified)
+            processed -= len(classified)
             remaining = len(all_articles) - processed
             logger.info(
                 f"Hit limit of {max_to_process}. {remaining} articles remaining."
@@ -387,6 +504,8 @@ async def fetch_job(
 
         # Abort early if Gemini API is consistently failing
         if is_circuit_open():
+            _cancel_prefetches(classified)
+            processed -= len(classified)
             remaining = len(all_articles) - processed
             logger.warning(
                 f"Circuit breaker open — aborting fetch. {remaining} articles skipped."
@@ -397,25 +516,128 @@ async def fetch_job(
             )
             break
 
-        processed += 1
+        if not classified:
+            # Pre-check articles until a classification batch is full
+            batch: list[tuple[str, FetchedArticle, str, str]] = []
+            # Window lookups predate this fill, so track what it has recorded since
+            window_start, keys, known = index, [], {}
+            fill_urls: set[str] = set()
+            fill_hashes: set[str] = set()
+            seen: list[tuple[str, str, Optional[str], str, Optional[str]]] = []
+            while index < len(all_articles) and len(batch) < CLASSIFY_BATCH_SIZE:
+                if index - window_start >= len(keys):
+                    window_start = index
+                    async with db_lock:
+                        keys, known = await asyncio.to_thread(
+                            _precheck_window, db_conn, all_articles, index
+                        )
+                source_name, article = all_articles[index]
+                normalized, content_hash = keys[index - window_start]
+                duplicate = known.get(index - window_start)
+                if duplicate is None and normalized in fill_urls:
+                    duplicate = "url"
+                elif duplicate is None and content_hash in fill_hashes:
+                    duplicate = "hash"
+                index += 1
+                processed += 1
+                try:
+                    # The fuzzy title scan is CPU-heavy, so it runs off the event loop
+                    async with db_lock:
+                        skip = await asyncio.to_thread(
+                            _precheck_article,
+                            db_conn,
+                            article,
+                            normalized,
+                            content_hash,
+                            duplicate,
+                            seen,
+                        )
+                    fill_urls.add(normalized)
+                    fill_hashes.add(content_hash)
+                    if skip is None:
+                        other = _find_batch_duplicate(
+                            batch, article, normalized, content_hash
+                        )
+                        if other:
+                            logger.debug(
+                                f"Duplicate within batch: {article.title[:50]} ~ {other.title[:50]}"
+                            )
+                            seen.append(
+                                (
+                                    normalized,
+                                    article.url,
+                                    content_hash,
+                                    "duplicate",
+                                    "duplicate within fetch batch",
+                                )
+                            )
+                            skip = "duplicate"
+                except Exception as e:
+                    logger.error(f"Error pre-checking article {article.url}: {e}")
+                    failed += 1
+                    continue
+                if skip == "duplicate":
+                    skipped_duplicates += 1
+                elif skip == "irrelevant":
+                    skipped_irrelevant += 1
+                else:
+                    batch.append((source_name, article, normalized, content_hash))
 
-        try:
-            result = await _process_article(
-                config, db_conn, db_lock, http_client, gemini_client,
-                source_name, article,
-            )
-            if result == "new":
+            async with db_lock:
+                await asyncio.to_thread(mark_urls_seen_bulk, db_conn, seen)
+
+            if batch and config.fuse_classify_translate:
+                # Fused mode: classified together with translation per article
+                classified = [(*item, None, None) for item in batch]
+            elif batch:
+                # Images download while the batch is classified; rejects are cancelled
+                prefetches = [
+                    _start_image_prefetch(config, http_client, item[1])
+                    for item in batch
+                ]
+                classifications = await classify_articles_batch(
+                    gemini_client, config.gemini_model, [item[1] for item in batch]
+                )
+                classified = []
+                for item, classification, media_task in zip(
+                    batch, classifications, prefetches
+                ):
+                    if classification is None:
+                        # Not marked seen, so the next fetch cycle retries it
+                        if media_task:
+                            media_task.cancel()
+                        processed -= 1
+                        continue
+                    if media_task and not classification.is_relevant:
+                        media_task.cancel()
+                        media_task = None
+                    classified.append((*item, classification, media_task))
+            continue
+
+        # Overlap media downloads and translations, never past the quota left
+        take = min(PROCESS_CONCURRENCY, max_to_process - new_articles)
+        chunk, classified = classified[:take], classified[take:]
+        results = await asyncio.gather(
+            *(
+                _process_article(
+                    config, db_conn, db_lock, http_client, gemini_client, *item
+                )
+                for item in chunk
+            ),
+            return_exceptions=True,
+        )
+        for item, result in zip(chunk, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error processing article {item[1].url}: {result}")
+                failed += 1
+            elif result == "new":
                 new_articles += 1
-                await asyncio.sleep(0.5)
-            elif result == "duplicate":
-                skipped_duplicates += 1
             elif result == "irrelevant":
                 skipped_irrelevant += 1
             elif result == "failed":
                 failed += 1
-        except Exception as e:
-            logger.error(f"Error processing article {article.url}: {e}")
-            failed += 1
+        if "new" in results:
+            await asyncio.sleep(0.5)
 
     # Calculate remaining (articles not yet processed)
     remaining = max(0, len(all_articles) - processed)
@@ -430,6 +652,7 @@ async def fetch_job(
     logger.info(
         f"Gemini API usage: {stats['classify_calls']} classifications, "
         f"{stats['translate_calls']} translations, "
+        f"{stats['skipped_calls']} skipped locally, "
         f"{stats['input_tokens']} input tokens, {stats['output_tokens']} output tokens"
     )
 
@@ -450,6 +673,15 @@ async def fetch_job(
     return remaining
 
 
+def _record_publish_failure(db_conn, article_id: int) -> int:
+    """Count a publish failure and reject on the last retry, in one commit."""
+    with transaction(db_conn):
+        fail_count = increment_publish_failures(db_conn, article_id, commit=False)
+        if fail_count >= MAX_PUBLISH_RETRIES:
+            update_article_status(db_conn, article_id, "rejected", commit=False)
+    return fail_count
+
+
 async def publish_job(config, db_conn, db_lock, bot) -> None:
     """Publish approved articles with rate limiting."""
     logger = logging.getLogger(__name__)
@@ -473,14 +705,14 @@ async def publish_job(config, db_conn, db_lock, bot) -> None:
 
     if success:
         async with db_lock:
-            mark_published(db_conn, article.id)
+            await asyncio.to_thread(mark_published, db_conn, article.id)
         logger.info(f"Published: {article.original_title[:50]}")
     else:
         async with db_lock:
-            fail_count = increment_publish_failures(db_conn, article.id)
+            fail_count = await asyncio.to_thread(
+                _record_publish_failure, db_conn, article.id
+            )
         if fail_count >= MAX_PUBLISH_RETRIES:
-            async with db_lock:
-                update_article_status(db_conn, article.id, "rejected")
             logger.error(
                 f"Article {article.id} rejected after {fail_count} publish failures"
             )
@@ -499,6 +731,7 @@ async def scheduler_loop(config, db_conn, db_lock, http_client, gemini_client, a
     """Main scheduling loop."""
     logger = logging.getLogger(__name__)
     bot = app.bot
+    fetch_now = app.bot_data["state"].fetch_now
 
     remaining_interval = REMAINING_CHECK_INTERVAL
     refetch_interval = REFETCH_INTERVAL
@@ -532,8 +765,8 @@ async def scheduler_loop(config, db_conn, db_lock, http_client, gemini_client, a
             queue_empty = queue_count == 0
 
             # Check for manual fetch trigger
-            if app.bot_data.get("fetch_now"):
-                app.bot_data["fetch_now"] = False
+            if fetch_now.is_set():
+                fetch_now.clear()
                 if not queue_empty:
                     logger.info(
                         f"Manual fetch skipped: {queue_count} articles in queue"
@@ -604,14 +837,18 @@ async def scheduler_loop(config, db_conn, db_lock, http_client, gemini_client, a
                         f"Media cleanup: {images_removed} images, {videos_removed} videos removed"
                     )
                 async with db_lock:
-                    urls_removed = cleanup_old_seen_urls(db_conn)
+                    urls_removed = await asyncio.to_thread(cleanup_old_seen_urls, db_conn)
                 if urls_removed:
                     logger.info(
                         f"Seen URLs cleanup: {urls_removed} old entries removed"
                     )
                 last_cleanup = current_time
 
-            await asyncio.sleep(60)  # Check every minute
+            # Check every minute, or right away when /fetch sets the event
+            try:
+                await asyncio.wait_for(fetch_now.wait(), timeout=60)
+            except TimeoutError:
+                pass
 
         except Exception as e:
             logger.error(f"Scheduler error: {e}")
@@ -620,8 +857,8 @@ async def scheduler_loop(config, db_conn, db_lock, http_client, gemini_client, a
 
 async def main() -> None:
     """Application entry point."""
-    # Load config
-    config = load_config()
+    # Load config (file parsing runs in a worker thread, off the event loop)
+    config = await asyncio.to_thread(load_config)
 
     # Validate and configure logging level
     valid_levels = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
@@ -638,7 +875,7 @@ async def main() -> None:
     logger.info("Starting Olamda nima gap? bot...")
 
     # Initialize database
-    db_conn = init_database(config.database_path)
+    db_conn = await asyncio.to_thread(init_database, config.database_path)
     logger.info("Database initialized")
 
     # Create async lock for DB write operations
@@ -655,6 +892,10 @@ async def main() -> None:
         try:
             gemini_client = init_gemini(config.gemini_api_key)
             logger.info(f"Gemini initialized with model: {config.gemini_model}")
+            llm_cache_path = os.path.join(config.data_dir, LLM_CACHE_FILE)
+            cached_responses = load_response_cache(llm_cache_path)
+            if cached_responses:
+                logger.info(f"Loaded {cached_responses} cached Gemini responses")
 
             app = create_bot(
                 config.telegram_bot_token,
@@ -711,10 +952,12 @@ async def main() -> None:
                     pass
             await app.updater.stop()
             await app.stop()
+            await app.bot_data["state"].status_writer.close()
             health_server.close()
             await health_server.wait_closed()
             await http_client.aclose()
             db_conn.close()
+            save_response_cache(llm_cache_path)
             logger.info("Shutdown complete")
 
 
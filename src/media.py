@@ -11,6 +11,8 @@ from urllib.parse import urlparse
 
 import httpx
 
+from .ai_cache import SingleFlight
+
 logger = logging.getLogger(__name__)
 
 # Telegram limits
@@ -67,6 +69,12 @@ def generate_filename(url: str, content_type: str) -> str:
     return f"{url_hash}{extension}"
 
 
+# Concurrent requests for the same media (crossposts, prefetch + retry) share
+# one download instead of racing to write the same cache file. A download
+# nobody waits for any more (e.g. a cancelled prefetch) is cancelled too.
+_media_downloads = SingleFlight(cancel_abandoned=True)
+
+
 async def download_image(
     http_client: httpx.AsyncClient,
     url: str,
@@ -77,6 +85,18 @@ async def download_image(
     Validates content-type and size from the response.
     Returns ImageResult with local path on success.
     """
+    return await _media_downloads.do(
+        f"image:{data_dir}:{url}",
+        lambda: _download_image(http_client, url, data_dir),
+    )
+
+
+async def _download_image(
+    http_client: httpx.AsyncClient,
+    url: str,
+    data_dir: str,
+) -> ImageResult:
+    """download_image body; runs once per URL at a time."""
     if not url:
         return ImageResult(success=False, error="No URL provided", original_url=url)
 
@@ -414,6 +434,19 @@ async def download_video(
     Handles Reddit videos (merges video + audio) and other sources.
     Returns VideoResult with local path on success.
     """
+    return await _media_downloads.do(
+        f"video:{data_dir}:{max_size}:{url}",
+        lambda: _download_video(url, data_dir, max_size, max_retries),
+    )
+
+
+async def _download_video(
+    url: str,
+    data_dir: str,
+    max_size: int,
+    max_retries: int,
+) -> VideoResult:
+    """download_video body; runs once per URL at a time."""
     if not url:
         return VideoResult(success=False, error="No URL provided", original_url=url)
 
@@ -0,0 +1,192 @@
+import asyncio
+import json
+import re
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.ai import (
+    CLASSIFIER_ARTICLE_PROMPT,
+    GEMINI_MAX_CONCURRENT,
+    TRANSLATOR_PROMPT,
+    _classify_chunk,
+    _gemini_semaphore,
+    _parse_classification,
+    _render_classifier_article,
+    _render_translator,
+    _zero_shot_classify,
+    call_with_backoff,
+    classify_articles_batch,
+    refresh_prompt_cache,
+)
+from src.ai_cache import SemanticCache
+
+
+def test_compiled_templates_match_str_format():
+    classifier_fields = {
+        "title": "Title {with braces}",
+        "content": "Content",
+        "media_url": "None",
+        "source_type": "reddit",
+    }
+    assert _render_classifier_article(**classifier_fields) == CLASSIFIER_ARTICLE_PROMPT.format(**classifier_fields)
+
+    translator_fields = {
+        "title": "Title",
+        "content": "Content",
+        "source_url": "https://example.com",
+        "source_name": "Source",
+        "media_type": "video",
+    }
+    assert _render_translator(**translator_fields) == TRANSLATOR_PROMPT.format(**translator_fields)
+
+
+@pytest.mark.asyncio
+async def test_call_with_backoff_gives_up_before_deadline():
+    calls = 0
+
+    async def flaky():
+        nonlocal calls
+        calls += 1
+        raise RuntimeError("503 Service Unavailable")
+
+    start = time.monotonic()
+    with pytest.raises(RuntimeError):
+        await call_with_backoff(flaky, deadline=2.5)
+    # 1s + 2s backoff would overshoot the deadline, so the third try never happens
+    assert calls == 2
+    assert time.monotonic() - start < 2.5
+
+
+@pytest.mark.asyncio
+async def test_call_with_backoff_deadline_excludes_queue_time():
+    async def quick():
+        return "ok"
+
+    # Every Gemini slot is busy for longer than the deadline
+    for _ in range(GEMINI_MAX_CONCURRENT):
+        await _gemini_semaphore.acquire()
+    call = asyncio.create_task(call_with_backoff(quick, deadline=0.1))
+    await asyncio.sleep(0.2)
+    for _ in range(GEMINI_MAX_CONCURRENT):
+        _gemini_semaphore.release()
+
+    assert await call == "ok"
+
+
+def test_zero_shot_only_rejects_clear_cases():
+    labels = ([[1.0, 0.0, 0.0]], [[0.0, 1.0, 0.0]])
+
+    # Never accepted without Gemini applying the exclude rules
+    assert _zero_shot_classify([1.0, 0.0, 0.0], labels) is None
+    assert _zero_shot_classify([0.0, 1.0, 0.0], labels).is_relevant is False
+    # Equally close to both label sets: leave it to Gemini
+    assert _zero_shot_classify([0.6, 0.6, 0.53], labels) is None
+
+
+@pytest.mark.asyncio
+async def test_classify_chunk_bisects_unparseable_batches():
+    batch_sizes = []
+
+    async def generate_content(model, contents, config):
+        ids = [int(n) for n in re.findall(r'"title": "t(\d+)"', contents)]
+        batch_sizes.append(len(ids))
+        if len(ids) == 4:
+            return SimpleNamespace(text="not json", candidates=None)
+        # Answers only the first id, so the rest are asked again
+        answer = [{"id": ids[0], "is_relevant": True, "reason": "ok"}]
+        return SimpleNamespace(text=json.dumps(answer), candidates=None)
+
+    client = SimpleNamespace(
+        aio=SimpleNamespace(models=SimpleNamespace(generate_content=generate_content))
+    )
+    items = [{"id": n, "title": f"t{n}"} for n in range(4)]
+
+    results = await _classify_chunk(client, "model", items)
+
+    assert [result.is_relevant for result in results] == [True] * 4
+    assert batch_sizes == [4, 2, 1, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_classify_articles_batch_reuses_semantic_verdicts(monkeypatch):
+    monkeypatch.setattr("src.ai._semantic_cache", SemanticCache())
+    monkeypatch.setattr("src.ai._label_embeddings", None)
+    generate_calls = 0
+
+    async def embed_content(model, contents):
+        # Every text is "about the same story"
+        return SimpleNamespace(embeddings=[SimpleNamespace(values=[1.0, 0.0]) for _ in contents])
+
+    async def generate_content(model, contents, config):
+        nonlocal generate_calls
+        generate_calls += 1
+        ids = [int(n) for n in re.findall(r'"id": (\d+)', contents)]
+        answer = [{"id": n, "is_relevant": True, "reason": "ok"} for n in ids]
+        return SimpleNamespace(text=json.dumps(answer), candidates=None)
+
+    client = SimpleNamespace(
+        aio=SimpleNamespace(
+            models=SimpleNamespace(embed_content=embed_content, generate_content=generate_content)
+        )
+    )
+
+    def article(title):
+        return SimpleNamespace(title=title, content="Body", image_url=None, source_type="rss")
+
+    first = await classify_articles_batch(client, "model", [article("Drone strike on depot")])
+    reworded = await classify_articles_batch(client, "model", [article("Depot hit by drone strike")])
+
+    assert first[0].is_relevant is True
+    assert reworded[0].is_relevant is True
+    assert generate_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_prompt_cache_backs_off_after_failed_create(monkeypatch):
+    monkeypatch.setattr("src.ai._prompt_cache_name", None)
+    monkeypatch.setattr("src.ai._prompt_cache_retry_at", 0.0)
+    creates = 0
+
+    async def create(model, config):
+        nonlocal creates
+        creates += 1
+        raise RuntimeError("400 Cached content is too small")
+
+    client = SimpleNamespace(aio=SimpleNamespace(caches=SimpleNamespace(create=create)))
+
+    assert await refresh_prompt_cache(client, "model") is None
+    assert await refresh_prompt_cache(client, "model") is None
+    assert creates == 1
+
+
+def test_parse_classification_requires_literal_true():
+    assert _parse_classification({"is_relevant": True, "reason": "ok"}).is_relevant is True
+    for value in ("false", "true", 1, None):
+        assert _parse_classification({"is_relevant": value}).is_relevant is False
+
+
+@pytest.mark.asyncio
+async def test_classify_articles_batch_leaves_failed_calls_unclassified(monkeypatch):
+    monkeypatch.setattr("src.ai._semantic_cache", SemanticCache())
+    monkeypatch.setattr("src.ai._label_embeddings", None)
+    monkeypatch.setattr("src.ai._consecutive_failures", 0)
+
+    async def embed_content(model, contents):
+        return SimpleNamespace(embeddings=[SimpleNamespace(values=[0.0, 1.0]) for _ in contents])
+
+    async def generate_content(model, contents, config):
+        raise RuntimeError("400 Bad Request")
+
+    client = SimpleNamespace(
+        aio=SimpleNamespace(
+            models=SimpleNamespace(embed_content=embed_content, generate_content=generate_content)
+        )
+    )
+    article = SimpleNamespace(
+        title="Bridge collapse caught on camera", content="Body", image_url=None, source_type="rss"
+    )
+
+    # None, not a "not relevant" verdict, so the caller can retry it next cycle
+    assert await classify_articles_batch(client, "model", [article]) == [None]
@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+
+from src.ai_cache import (
+    LLMCache,
+    SemanticCache,
+    SingleFlight,
+    make_cache_key,
+    normalize_vector,
+)
+
+
+def test_cache_key_depends_on_model():
+    assert make_cache_key("a", "prompt") != make_cache_key("b", "prompt")
+
+
+@pytest.mark.asyncio
+async def test_cache_evicts_least_recently_used():
+    cache = LLMCache(max_entries=2)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    await cache.get("a")
+    await cache.set("c", 3)
+    assert await cache.get("a") == 1
+    assert await cache.get("b") is None
+
+
+@pytest.mark.asyncio
+async def test_cache_expires_entries():
+    cache = LLMCache(ttl=-1)
+    await cache.set("a", 1)
+    assert await cache.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_cache_persists_to_disk(tmp_path):
+    path = str(tmp_path / "cache.json")
+    cache = LLMCache()
+    await cache.set("a", {"is_relevant": True, "reason": "ok"})
+    assert cache.save(path) == 1
+
+    restored = LLMCache()
+    assert restored.load(path) == 1
+    assert await restored.get("a") == {"is_relevant": True, "reason": "ok"}
+
+
+def test_semantic_cache_matches_similar_vectors():
+    cache = SemanticCache(threshold=0.9)
+    cache.add(normalize_vector([1.0, 0.0]), "x")
+    assert cache.lookup(normalize_vector([1.0, 0.1])) == "x"
+    assert cache.lookup(normalize_vector([0.0, 1.0])) is None
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_concurrent_calls():
+    group = SingleFlight()
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    results = await asyncio.gather(*(group.do("key", work) for _ in range(3)))
+    assert results == [1, 1, 1]
+    assert calls == 1
+    assert len(group) == 0
+
+
+@pytest.mark.asyncio
+async def test_single_flight_cancels_abandoned_call():
+    group = SingleFlight(cancel_abandoned=True)
+    started = asyncio.Event()
+    finished = False
+
+    async def work():
+        nonlocal finished
+        started.set()
+        await asyncio.sleep(0.05)
+        finished = True
+        return "done"
+
+    first = asyncio.create_task(group.do("key", work))
+    second = asyncio.create_task(group.do("key", work))
+    await started.wait()
+
+    # One caller left: the shared call keeps running for the other
+    first.cancel()
+    await asyncio.sleep(0)
+    assert not second.done()
+
+    second.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await second
+    await asyncio.sleep(0.1)
+    assert not finished
+    assert len(group) == 0
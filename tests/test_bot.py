@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.bot import send_approval_batch
+from src.database import Article
+
+
+def _article(article_id: int, title: str) -> Article:
+    return Article(
+        article_id, "src", f"https://a.com/{article_id}", title, "summary", None,
+        "https://i.com/a.jpg", None, None, "image", "matn", "pending", "2024-01-01", None,
+    )
+
+
+class FakeBot:
+    def __init__(self, fail_buttons: bool = False):
+        self.fail_buttons = fail_buttons
+        self.media_groups = []
+        self.messages = []
+
+    async def send_media_group(self, chat_id, media):
+        self.media_groups.append(media)
+        return [SimpleNamespace(photo=[SimpleNamespace(file_id=f"f{n}")]) for n in range(len(media))]
+
+    async def send_message(self, chat_id, text, **kwargs):
+        self.messages.append(text)
+        if self.fail_buttons:
+            raise RuntimeError("boom")
+
+
+@pytest.mark.asyncio
+async def test_approval_batch_escapes_titles():
+    bot = FakeBot()
+
+    sent = await send_approval_batch(bot, 1, [_article(1, "A & B <3"), _article(2, "C")])
+
+    assert sent == 2
+    assert "#1 A &amp; B &lt;3" in bot.messages[0]
+    assert "A &amp; B &lt;3" in bot.media_groups[0][0].caption
+
+
+@pytest.mark.asyncio
+async def test_approval_batch_does_not_resend_previews_when_buttons_fail():
+    bot = FakeBot(fail_buttons=True)
+
+    sent = await send_approval_batch(bot, 1, [_article(1, "A"), _article(2, "B")])
+
+    assert sent == 0
+    assert len(bot.media_groups) == 1
+    assert len(bot.messages) == 1
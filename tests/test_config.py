@@ -8,4 +8,8 @@ def test_load_config_returns_config():
 
 def test_config_has_sources():
     config = load_config()
-    assert isinstance(config.sources, list)
+    assert isinstance(config.sources, tuple)
+
+
+def test_load_config_is_cached():
+    assert load_config() is load_config()
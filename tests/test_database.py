@@ -0,0 +1,115 @@
+import sqlite3
+
+from src.database import (
+    check_duplicates,
+    create_articles_bulk,
+    find_similar_title,
+    init_database,
+    mark_url_seen,
+    mark_urls_seen_bulk,
+)
+
+
+def test_check_duplicates_reports_url_and_hash_hits(tmp_path):
+    conn = init_database(str(tmp_path / "db.sqlite"))
+    mark_url_seen(conn, "https://a.com/1", "hash1", "irrelevant", normalized="a.com/1")
+
+    hits = check_duplicates(
+        conn,
+        [("a.com/1", "other"), ("b.com/2", "hash1"), ("c.com/3", "hash3")],
+    )
+
+    assert hits == {0: "url", 1: "hash"}
+
+
+def test_mark_urls_seen_bulk_upserts(tmp_path):
+    conn = init_database(str(tmp_path / "db.sqlite"))
+    mark_url_seen(conn, "https://a.com/1", "h1", "failed", "timeout", normalized="a.com/1")
+
+    mark_urls_seen_bulk(
+        conn,
+        [
+            ("a.com/1", "https://a.com/1", "h1", "irrelevant", "no media"),
+            ("b.com/2", "https://b.com/2", "h2", "duplicate", "content hash match"),
+        ],
+    )
+
+    rows = conn.execute(
+        "SELECT normalized_url, status, reason FROM seen_urls ORDER BY normalized_url"
+    ).fetchall()
+    assert [tuple(row) for row in rows] == [
+        ("a.com/1", "irrelevant", "no media"),
+        ("b.com/2", "duplicate", "content hash match"),
+    ]
+
+
+def test_mark_url_seen_updates_existing_entry(tmp_path):
+    conn = init_database(str(tmp_path / "db.sqlite"))
+    mark_url_seen(conn, "https://a.com/1", "h1", "failed", "timeout")
+    mark_url_seen(conn, "https://a.com/1", "h2", "irrelevant", "low karma")
+
+    rows = conn.execute("SELECT content_hash, status, reason FROM seen_urls").fetchall()
+    assert [tuple(row) for row in rows] == [("h2", "irrelevant", "low karma")]
+
+
+def test_init_database_backfills_normalized_url_on_legacy_db(tmp_path):
+    path = str(tmp_path / "db.sqlite")
+    legacy = sqlite3.connect(path)
+    legacy.execute(
+        """
+        CREATE TABLE articles (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            source_name TEXT NOT NULL,
+            original_url TEXT NOT NULL UNIQUE,
+            original_title TEXT NOT NULL,
+            original_summary TEXT NOT NULL,
+            content_hash TEXT,
+            uzbek_content TEXT,
+            status TEXT NOT NULL DEFAULT 'pending',
+            created_at TEXT NOT NULL,
+            published_at TEXT
+        )
+        """
+    )
+    legacy.executemany(
+        "INSERT INTO articles (source_name, original_url, original_title, "
+        "original_summary, created_at) VALUES ('s', ?, 't', 's', '2024-01-01')",
+        [("https://www.reddit.com/r/a/?utm_source=x",), ("https://b.com/post/",)],
+    )
+    legacy.commit()
+    legacy.close()
+
+    conn = init_database(path)
+
+    rows = conn.execute("SELECT normalized_url FROM articles ORDER BY id").fetchall()
+    assert [row[0] for row in rows] == ["https://reddit.com/r/a", "https://b.com/post"]
+
+
+def test_create_articles_bulk_returns_ids_in_order(tmp_path):
+    conn = init_database(str(tmp_path / "db.sqlite"))
+    rows = [
+        ("src", f"https://a.com/{i}", f"https://a.com/{i}", f"title {i}", "summary",
+         None, None, None, None, "image", "matn", None, None)
+        for i in range(3)
+    ]
+
+    ids = create_articles_bulk(conn, rows, status="approved")
+
+    stored = conn.execute("SELECT id, original_url, status FROM articles").fetchall()
+    assert [tuple(row) for row in stored] == [
+        (article_id, row[1], "approved") for article_id, row in zip(ids, rows)
+    ]
+
+
+def test_find_similar_title_matches_edits_with_low_trigram_overlap(tmp_path):
+    conn = init_database(str(tmp_path / "db.sqlite"))
+    create_articles_bulk(
+        conn,
+        [("src", "https://a.com/1", "https://a.com/1", "over robot the ancient lazy space", "summary",
+          None, None, None, None, "image", "matn", None, None)],
+    )
+
+    # ratio 0.94, but few shared character trigrams
+    similar = find_similar_title(conn, "over rbot the ancienth lay jspace")
+
+    assert similar is not None and similar.original_url == "https://a.com/1"
@@ -0,0 +1,29 @@
+import httpx
+import pytest
+
+from src.fetcher import fetch_rss
+
+FEED = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>t</title>
+<item><title>A &amp; <b>B</b></title><link>https://example.com/a</link>
+<description>&lt;p&gt;Hello&lt;/p&gt;</description></item>
+</channel></rss>"""
+
+
+@pytest.mark.asyncio
+async def test_fetch_rss_reuses_articles_on_not_modified():
+    seen_headers = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text=FEED, headers={"ETag": '"v1"'})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        first = await fetch_rss(client, "https://example.com/feed")
+        second = await fetch_rss(client, "https://example.com/feed")
+
+    assert seen_headers == [None, '"v1"']
+    assert [a.title for a in first] == ["A & B"]
+    assert second == first
@@ -24,3 +24,17 @@ def test_import_fetcher():
 
 def test_import_media():
     import src.media  # noqa: F401
+
+
+def test_no_duplicate_top_level_defs():
+    import ast
+    from pathlib import Path
+
+    for path in Path(__file__).parent.parent.joinpath("src").glob("*.py"):
+        names = [
+            node.name
+            for node in ast.parse(path.read_text()).body
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+        ]
+        duplicates = {name for name in names if names.count(name) > 1}
+        assert not duplicates, f"{path.name} defines {sorted(duplicates)} more than once"
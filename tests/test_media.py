@@ -0,0 +1,26 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.media import download_image
+
+
+@pytest.mark.asyncio
+async def test_concurrent_downloads_of_one_image_share_a_request(tmp_path):
+    requests = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal requests
+        requests += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, content=b"\xff" * 2048, headers={"content-type": "image/jpeg"})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        first, second = await asyncio.gather(
+            download_image(client, "https://example.com/a.jpg", data_dir=str(tmp_path)),
+            download_image(client, "https://example.com/a.jpg", data_dir=str(tmp_path)),
+        )
+
+    assert requests == 1
+    assert first.success and first.local_path == second.local_path